@@ -1,4 +1,25 @@
-from cortex.api.auth import access, authorize, get_info, get_license_info, get_user_info, generate_new_token
+"""Builders of the Cortex API requests.
+
+Every builder returns a JSON-RPC request, ready to be serialized with `to_bytes`. The
+`id`, `jsonrpc` and `method` of each request are fixed, so every module builds them
+once at import time, as a private skeleton (e.g. `_CREATE_SESSION`), and each call
+merges the skeleton with its own `params` instead of rebuilding the envelope.
+
+The IDs of the skeletons are the `IntEnum` members of `cortex.api.id`, converted to
+plain ints, so serializers never dispatch on `IntEnum` while encoding a request.
+
+"""
+
+from cortex.api.auth import (
+    access,
+    authorize,
+    encode_get_info,
+    get_info,
+    get_license_info,
+    get_user_info,
+    generate_new_token,
+)
+from cortex.api.batch import batch, original_id, split_batch_response
 from cortex.api.events import (
     ErrorEvent,
     MarkerEvent,
@@ -14,6 +35,7 @@ from cortex.api.handler import stream_data
 from cortex.api.headset import (
     make_connection,
     query_headset,
+    encode_query_headset,
     update_headset,
     update_custom_info,
     sync_with_clock,
@@ -34,7 +56,9 @@ from cortex.api.markers import inject_marker, update_marker
 from cortex.api.mental_command import action_sensitivity, brain_map, active_action, get_skill_rating, training_threshold
 from cortex.api.profile import current_profile, query_profile, setup_profile, load_guest, detection_info
 from cortex.api.record import (
+    RecordClient,
     create_record,
+    create_records_batch,
     config_opt_out,
     delete_record,
     download_record_data,
@@ -52,9 +76,17 @@ from cortex.api.response import (
     SettingsObject,
     SubjectObject,
 )
-from cortex.api.session import create_session, update_session, query_session
-from cortex.api.subject import create_subject, delete_subject, query_subject, update_subject, get_demographic_attr
-from cortex.api.train import training, trained_signature_actions, training_time
+from cortex.api.serialize import JsonRpcRequest, to_bytes
+from cortex.api.session import create_session, update_session, query_session, encode_query_session
+from cortex.api.subject import (
+    create_subject,
+    delete_subject,
+    query_subject,
+    update_subject,
+    get_demographic_attr,
+    encode_demographic_attr,
+)
+from cortex.api.train import training, training_sequence, trained_signature_actions, training_time
 from cortex.api.types import (
     Attribute,
     AuthorizeRequest,
@@ -90,9 +122,14 @@ __all__ = [
     'access',
     'authorize',
     'get_info',
+    'encode_get_info',
     'get_license_info',
     'get_user_info',
     'generate_new_token',
+    # Batch.
+    'batch',
+    'original_id',
+    'split_batch_response',
     # Events.
     'ErrorEvent',
     'MarkerEvent',
@@ -110,6 +147,7 @@ __all__ = [
     # Headset.
     'make_connection',
     'query_headset',
+    'encode_query_headset',
     'update_headset',
     'update_custom_info',
     'sync_with_clock',
@@ -140,7 +178,9 @@ __all__ = [
     'query_profile',
     'setup_profile',
     # Record.
+    'RecordClient',
     'create_record',
+    'create_records_batch',
     'config_opt_out',
     'delete_record',
     'download_record_data',
@@ -156,18 +196,24 @@ __all__ = [
     'SessionObject',
     'SettingsObject',
     'SubjectObject',
+    # Serialize.
+    'JsonRpcRequest',
+    'to_bytes',
     # Session.
     'create_session',
     'update_session',
     'query_session',
+    'encode_query_session',
     # Subject.
     'create_subject',
     'delete_subject',
     'query_subject',
     'update_subject',
     'get_demographic_attr',
+    'encode_demographic_attr',
     # Train.
     'training',
+    'training_sequence',
     'trained_signature_actions',
     'training_time',
     # Types.
@@ -18,11 +18,40 @@ if it is not expired.
 
 """
 
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal
 
 from cortex.api.id import AuthID
+from cortex.api.serialize import to_bytes
 from cortex.api.types import AuthorizeRequest, BaseRequest
 
+_CORTEX_INFO: Final[Mapping[str, Any]] = {'id': int(AuthID.CORTEX_INFO), 'jsonrpc': '2.0', 'method': 'getCortexInfo'}
+_USER_LOGIN: Final[Mapping[str, Any]] = {'id': int(AuthID.USER_LOGIN), 'jsonrpc': '2.0', 'method': 'getUserLogin'}
+_REQUEST_ACCESS: Final[Mapping[str, Any]] = {
+    'id': int(AuthID.REQUEST_ACCESS),
+    'jsonrpc': '2.0',
+    'method': 'requestAccess',
+}
+_HAS_ACCESS_RIGHT: Final[Mapping[str, Any]] = {
+    'id': int(AuthID.HAS_ACCESS_RIGHT),
+    'jsonrpc': '2.0',
+    'method': 'hasAccessRight',
+}
+_AUTHORIZE: Final[Mapping[str, Any]] = {'id': int(AuthID.AUTHORIZE), 'jsonrpc': '2.0', 'method': 'authorize'}
+_GEN_NEW_TOKEN: Final[Mapping[str, Any]] = {
+    'id': int(AuthID.GEN_NEW_TOKEN),
+    'jsonrpc': '2.0',
+    'method': 'generateNewToken',
+}
+_USER_INFO: Final[Mapping[str, Any]] = {'id': int(AuthID.USER_INFO), 'jsonrpc': '2.0', 'method': 'getUserInformation'}
+_LICENSE_INFO: Final[Mapping[str, Any]] = {'id': int(AuthID.LICENSE_INFO), 'jsonrpc': '2.0', 'method': 'getLicenseInfo'}
+
+# Valid methods of `access`.
+_ACCESS_METHODS: Final[frozenset[str]] = frozenset(('requestAccess', 'hasAccessRight'))
+
+# The encoded `getCortexInfo` request. It has no params, so it is encoded once.
+_CORTEX_INFO_BYTES: Final[bytes] = to_bytes(_CORTEX_INFO)
+
 
 def get_info() -> BaseRequest:
     """Get the Cortex info.
@@ -34,9 +63,21 @@ def get_info() -> BaseRequest:
         BaseRequest: The Cortex info.
 
     """
-    _info = {'id': AuthID.CORTEX_INFO, 'jsonrpc': '2.0', 'method': 'getCortexInfo'}
+    return {**_CORTEX_INFO}
+
 
-    return _info
+def encode_get_info() -> bytes:
+    """Get the Cortex info, encoded as compact JSON.
+
+    Notes:
+        The `getCortexInfo` request never changes, so it is encoded once at
+        import time and the same bytes are returned on every call.
+
+    Returns:
+        bytes: The encoded `get_info` request, ready to be sent over the websocket.
+
+    """
+    return _CORTEX_INFO_BYTES
 
 
 def get_user_login() -> BaseRequest:
@@ -49,9 +90,7 @@ def get_user_login() -> BaseRequest:
         BaseRequest: The user login request.
 
     """
-    _login = {'id': AuthID.USER_LOGIN, 'jsonrpc': '2.0', 'method': 'getUserLogin'}
-
-    return _login
+    return {**_USER_LOGIN}
 
 
 def access(client_id: str, client_secret: str, *, method: Literal['requestAccess', 'hasAccessRight']) -> BaseRequest:
@@ -70,22 +109,12 @@ def access(client_id: str, client_secret: str, *, method: Literal['requestAccess
         BaseRequest: The access status.
 
     """
-    if method not in ('requestAccess', 'hasAccessRight'):
+    if method not in _ACCESS_METHODS:
         raise ValueError('method must be either "requestAccess" or "hasAccessRight".')
 
-    if method == 'requestAccess':
-        _id = AuthID.REQUEST_ACCESS
-    else:
-        _id = AuthID.HAS_ACCESS_RIGHT
-
-    _access = {
-        'id': _id,
-        'jsonrpc': '2.0',
-        'method': method,
-        'params': {'clientId': client_id, 'clientSecret': client_secret},
-    }
+    _template = _REQUEST_ACCESS if method == 'requestAccess' else _HAS_ACCESS_RIGHT
 
-    return _access
+    return {**_template, 'params': {'clientId': client_id, 'clientSecret': client_secret}}
 
 
 def authorize(
@@ -115,17 +144,17 @@ def authorize(
         AuthorizeRequest: The authorization status.
 
     """
-    _params = {'clientId': client_id, 'clientSecret': client_secret}
-
-    if license is not None:
-        _params['license'] = license
-
-    if debit is not None:
-        _params['debit'] = debit  # type: ignore[assignment]
-
-    authorization = {'id': AuthID.AUTHORIZE, 'jsonrpc': '2.0', 'method': 'authorize', 'params': _params}
+    _params: dict[str, Any]
+    if license is None and debit is None:
+        _params = {'clientId': client_id, 'clientSecret': client_secret}
+    elif debit is None:
+        _params = {'clientId': client_id, 'clientSecret': client_secret, 'license': license}
+    elif license is None:
+        _params = {'clientId': client_id, 'clientSecret': client_secret, 'debit': debit}
+    else:
+        _params = {'clientId': client_id, 'clientSecret': client_secret, 'license': license, 'debit': debit}
 
-    return authorization
+    return {**_AUTHORIZE, 'params': _params}
 
 
 def generate_new_token(auth: str, client_id: str, client_secret: str) -> BaseRequest:
@@ -147,14 +176,7 @@ def generate_new_token(auth: str, client_id: str, client_secret: str) -> BaseReq
         BaseRequest: The new token.
 
     """
-    _token = {
-        'id': AuthID.GEN_NEW_TOKEN,
-        'jsonrpc': '2.0',
-        'method': 'generateNewToken',
-        'params': {'cortexToken': auth, 'clientId': client_id, 'clientSecret': client_secret},
-    }
-
-    return _token
+    return {**_GEN_NEW_TOKEN, 'params': {'cortexToken': auth, 'clientId': client_id, 'clientSecret': client_secret}}
 
 
 def get_user_info(auth: str) -> BaseRequest:
@@ -170,9 +192,7 @@ def get_user_info(auth: str) -> BaseRequest:
        BaseRequest: The user information.
 
     """
-    _info = {'id': AuthID.USER_INFO, 'jsonrpc': '2.0', 'method': 'getUserInformation', 'params': {'cortexToken': auth}}
-
-    return _info
+    return {**_USER_INFO, 'params': {'cortexToken': auth}}
 
 
 def get_license_info(auth: str) -> BaseRequest:
@@ -188,6 +208,4 @@ def get_license_info(auth: str) -> BaseRequest:
         BaseRequest: The license information.
 
     """
-    _info = {'id': AuthID.LICENSE_INFO, 'jsonrpc': '2.0', 'method': 'getLicenseInfo', 'params': {'cortexToken': auth}}
-
-    return _info
+    return {**_LICENSE_INFO, 'params': {'cortexToken': auth}}
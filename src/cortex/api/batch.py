@@ -0,0 +1,85 @@
+"""## JSON-RPC [batch].
+
+Several requests can be sent to Cortex as a single JSON-RPC batch, i.e. a list of
+requests serialized into one websocket frame, instead of one frame (and one round
+trip) per request. Cortex answers with a list of responses, in any order.
+
+The requests returned by the builders (e.g. `create_subject`, `training`) share the
+ID of their method, so two requests of the same batch could not be told apart.
+`batch` gives every request its own ID, and `split_batch_response` matches the
+responses back to the requests by ID.
+
+A batch ID still carries the ID of the original request, see `original_id`. This
+is how `Headset` dispatches each response of a batch like the response of a
+single request of the same method.
+
+[batch]: https://www.jsonrpc.org/specification#batch
+
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import count
+from typing import Any, Final
+
+# A batch ID is `n * _BATCH_ID_STRIDE + id`, where `id` is the ID of the original
+# request (see `cortex.api.id`) and `n` a sequence number. Batch IDs are therefore
+# greater than every Cortex API request ID, and the original ID is their remainder.
+_BATCH_ID_STRIDE: Final[int] = 1000
+_sequence = count(1)
+
+
+def batch(requests: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Pack requests into a JSON-RPC batch.
+
+    Notes:
+        The requests are copied, the given requests keep their ID.
+
+    Args:
+        requests (Iterable[Mapping[str, Any]]): The requests returned by the request builders.
+
+    Returns:
+        list[dict[str, Any]]: The batch, where each request has a unique ID.
+            Serialize it (e.g. with `to_bytes`) and send it as a single frame.
+
+    """
+    return [{**request, 'id': next(_sequence) * _BATCH_ID_STRIDE + request['id']} for request in requests]
+
+
+def original_id(request_id: int) -> int:
+    """Get the ID of the original request of a batch request.
+
+    Args:
+        request_id (int): The ID of a request or of a response, e.g. the ID of a
+            request returned by `batch`.
+
+    Returns:
+        int: The ID given by the request builder, i.e. the ID of the request method.
+            IDs which aren't batch IDs are returned as is.
+
+    """
+    return request_id % _BATCH_ID_STRIDE
+
+
+def split_batch_response(
+    requests: Sequence[Mapping[str, Any]], responses: Iterable[Mapping[str, Any]]
+) -> list[Mapping[str, Any]]:
+    """Match the responses of a batch to its requests.
+
+    Args:
+        requests (Sequence[Mapping[str, Any]]): The batch returned by `batch`.
+        responses (Iterable[Mapping[str, Any]]): The responses sent by Cortex, in any order.
+
+    Raises:
+        ValueError: If a request of the batch has no response.
+
+    Returns:
+        list[Mapping[str, Any]]: The response of each request, in the order of the
+            requests. A response is either a result or an error response.
+
+    """
+    _responses = {response['id']: response for response in responses}
+
+    try:
+        return [_responses[request['id']] for request in requests]
+    except KeyError as e:
+        raise ValueError(f'No response to the batch request {e.args[0]}.') from None
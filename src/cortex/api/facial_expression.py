@@ -1,10 +1,26 @@
 """Facial Expression API."""
 
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal
 
 from cortex.api.id import FacialExpressionID
 from cortex.api.types import FacialExpressionRequest
 
+_SIGNATURE_TYPE: Final[Mapping[str, Any]] = {
+    'id': int(FacialExpressionID.SIGNATURE_TYPE),
+    'jsonrpc': '2.0',
+    'method': 'facialExpressionSignatureType',
+}
+_THRESHOLD: Final[Mapping[str, Any]] = {
+    'id': int(FacialExpressionID.THRESHOLD),
+    'jsonrpc': '2.0',
+    'method': 'facialExpressionThreshold',
+}
+
+# Valid statuses of both requests, and the valid signature types.
+_STATUSES: Final[frozenset[str]] = frozenset(('set', 'get'))
+_SIGNATURES: Final[frozenset[str]] = frozenset(('universal', 'trained'))
+
 
 def signature_type(
     auth: str,
@@ -32,7 +48,7 @@ def signature_type(
         FacialExpressionRequest: The facial expression signature type.
 
     """
-    if status not in ('set', 'get'):
+    if status not in _STATUSES:
         raise ValueError('status must be either "set" or "get".')
 
     _params = {'cortexToken': auth, 'status': status}
@@ -46,21 +62,14 @@ def signature_type(
         raise AttributeError('Either profile_name or session_id must be provided, not both at the same time.')
 
     if signature is not None and status == 'set':
-        if signature not in {'universal', 'trained'}:
+        if signature not in _SIGNATURES:
             raise ValueError('signature must be either "universal" or "trained".')
         _params['signature'] = signature
     else:
         if status == 'set':
             raise AttributeError('signature must be provided when status is "set".')
 
-    _signature = {
-        'id': FacialExpressionID.SIGNATURE_TYPE,
-        'jsonrpc': '2.0',
-        'method': 'facialExpressionSignatureType',
-        'params': _params,
-    }
-
-    return _signature
+    return {**_SIGNATURE_TYPE, 'params': _params}
 
 
 def threshold(
@@ -96,10 +105,10 @@ def threshold(
         FacialExpressionRequest: The facial expression threshold.
 
     """
-    if status not in ('set', 'get'):
+    if status not in _STATUSES:
         raise ValueError('status must be either "set" or "get".')
 
-    _params = {'cortexToken': auth, 'status': status, 'action': action}
+    _params: dict[str, Any] = {'cortexToken': auth, 'status': status, 'action': action}
 
     # Either profile_name or session_id must be provided, not both at the same time.
     if profile_name is not None and session_id is None:
@@ -112,16 +121,9 @@ def threshold(
     if value is not None and status == 'set':
         if not 0 <= value <= 1000:
             raise ValueError('value must be between 0 and 1000.')
-        _params['value'] = value  # type: ignore[assignment]
+        _params['value'] = value
     else:
         if status == 'set':
             raise AttributeError('value must be provided when status is "set".')
 
-    _threshold = {
-        'id': FacialExpressionID.THRESHOLD,
-        'jsonrpc': '2.0',
-        'method': 'facialExpressionThreshold',
-        'params': _params,
-    }
-
-    return _threshold
+    return {**_THRESHOLD, 'params': _params}
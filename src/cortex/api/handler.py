@@ -1,7 +1,63 @@
 """Data stream handler."""
 
-from collections.abc import Mapping
-from typing import Any, Literal
+from collections.abc import Callable, Mapping
+from typing import Any, Final, Literal
+
+
+def _com(data: Mapping[str, Any]) -> dict[str, Any]:
+    return {'action': data['com'][0], 'power': data['com'][1], 'time': data['time']}
+
+
+def _fac(data: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        'eyeAct': data['fac'][0],  # eye action
+        'uAct': data['fac'][1],  # upper action
+        'uPow': data['fac'][2],  # upper action power
+        'lAct': data['fac'][3],  # lower action
+        'lPow': data['fac'][4],  # lower action power
+        'time': data['time'],
+    }
+
+
+def _eeg(data: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        # FIXME(victor-iyi): Possible bug.
+        'eeg': data['eeg'],  # remove markers
+        'time': data['time'],
+    }
+
+
+def _mot(data: Mapping[str, Any]) -> dict[str, Any]:
+    return {'mot': data['mot'], 'time': data['time']}
+
+
+def _dev(data: Mapping[str, Any]) -> dict[str, Any]:
+    return {'signal': data['dev'][1], 'dev': data['dev'][2], 'batteryPercent': data['dev'][3], 'time': data['time']}
+
+
+def _met(data: Mapping[str, Any]) -> dict[str, Any]:
+    return {'met': data['met'], 'time': data['time']}
+
+
+def _pow(data: Mapping[str, Any]) -> dict[str, Any]:
+    return {'pow': data['pow'], 'time': data['time']}
+
+
+def _sys(data: Mapping[str, Any]) -> Any:
+    return data['sys']
+
+
+# Only the requested stream is read: a stream data message carries a single stream.
+_STREAM_HANDLERS: Final[Mapping[str, Callable[[Mapping[str, Any]], Any]]] = {
+    'com': _com,
+    'fac': _fac,
+    'eeg': _eeg,
+    'mot': _mot,
+    'dev': _dev,
+    'met': _met,
+    'pow': _pow,
+    'sys': _sys,
+}
 
 
 def stream_data(data: Mapping[str, Any], key: Literal['com', 'fac', 'eeg', 'mot', 'dev', 'met', 'pow', 'sys']) -> Any:
@@ -15,34 +71,9 @@ def stream_data(data: Mapping[str, Any], key: Literal['com', 'fac', 'eeg', 'mot'
         Any: The streamed data.
 
     """
-    _result = {
-        'com': {'action': data['com'][0], 'power': data['com'][1], 'time': data['time']},
-        'fac': {
-            'eyeAct': data['fac'][0],  # eye action
-            'uAct': data['fac'][1],  # upper action
-            'uPow': data['fac'][2],  # upper action power
-            'lAct': data['fac'][3],  # lower action
-            'lPow': data['fac'][4],  # lower action power
-            'time': data['time'],
-        },
-        'eeg': {
-            # FIXME(victor-iyi): Possible bug.
-            'eeg': data['eeg'],  # remove markers
-            'time': data['time'],
-        },
-        'mot': {'mot': data['mot'], 'time': data['time']},
-        'dev': {
-            'signal': data['dev'][1],
-            'dev': data['dev'][2],
-            'batteryPercent': data['dev'][3],
-            'time': data['time'],
-        },
-        'met': {'met': data['met'], 'time': data['time']},
-        'pow': {'pow': data['pow'], 'time': data['time']},
-        'sys': data['sys'],
-    }
-
-    if key not in _result:
-        raise KeyError(f'Unknown key: {key}')
+    try:
+        handler = _STREAM_HANDLERS[key]
+    except KeyError:
+        raise KeyError(f'Unknown key: {key}') from None
 
-    return _result[key]
+    return handler(data)
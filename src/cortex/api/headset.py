@@ -15,9 +15,12 @@ If the headset is not connected to Cortex yet, then you must call controlDevice_
 
 # mypy: disable-error-code=assignment
 
-from typing import Literal
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Final, Literal
 
 from cortex.api.id import HeadsetID
+from cortex.api.serialize import to_bytes
 from cortex.api.types import (
     BaseRequest,
     ConnectHeadsetRequest,
@@ -28,6 +31,41 @@ from cortex.api.types import (
     UpdateHeadsetRequest,
 )
 
+_CONNECT: Final[Mapping[str, Any]] = {'id': int(HeadsetID.CONNECT), 'jsonrpc': '2.0', 'method': 'controlDevice'}
+_DISCONNECT: Final[Mapping[str, Any]] = {'id': int(HeadsetID.DISCONNECT), 'jsonrpc': '2.0', 'method': 'controlDevice'}
+_QUERY_HEADSET: Final[Mapping[str, Any]] = {
+    'id': int(HeadsetID.QUERY_HEADSET),
+    'jsonrpc': '2.0',
+    'method': 'queryHeadsets',
+}
+_UPDATE_HEADSET: Final[Mapping[str, Any]] = {
+    'id': int(HeadsetID.UPDATE_HEADSET),
+    'jsonrpc': '2.0',
+    'method': 'updateHeadset',
+}
+_UPDATE_CUSTOM_INFO: Final[Mapping[str, Any]] = {
+    'id': int(HeadsetID.UPDATE_CUSTOM_INFO),
+    'jsonrpc': '2.0',
+    'method': 'updateHeadsetCustomInfo',
+}
+_SYNC_WITH_CLOCK: Final[Mapping[str, Any]] = {
+    'id': int(HeadsetID.SYNC_WITH_CLOCK),
+    'jsonrpc': '2.0',
+    'method': 'syncWithHeadsetClock',
+}
+_SUBSCRIBE: Final[Mapping[str, Any]] = {'id': int(HeadsetID.SUBSCRIBE), 'jsonrpc': '2.0', 'method': 'subscribe'}
+_UNSUBSCRIBE: Final[Mapping[str, Any]] = {'id': int(HeadsetID.UNSUBSCRIBE), 'jsonrpc': '2.0', 'method': 'unsubscribe'}
+
+# Valid methods of `subscription`.
+_SUBSCRIPTION_METHODS: Final[frozenset[str]] = frozenset(('subscribe', 'unsubscribe'))
+
+# Valid headband positions of `updateHeadsetCustomInfo`.
+_HEADBAND_POSITIONS: Final[frozenset[str]] = frozenset(('back', 'top'))
+
+# EEG and motion sensor rates (Hz) supported by EPOC+ headsets.
+_EPOCPLUS_EEG_RATES: Final[frozenset[int]] = frozenset((128, 256))
+_EPOCPLUS_MEMS_RATES: Final[frozenset[int]] = frozenset((0, 32, 64, 128))
+
 
 def make_connection(
     command: Literal['connect', 'disconnect', 'refresh'],
@@ -57,9 +95,9 @@ def make_connection(
     _params = {'command': command}
 
     if command in ('connect', 'refresh'):
-        _id = HeadsetID.CONNECT
+        _template = _CONNECT
     elif command == 'disconnect':
-        _id = HeadsetID.DISCONNECT
+        _template = _DISCONNECT
     else:
         raise ValueError('command must be either "connect", "disconnect", or "refresh".')
 
@@ -79,9 +117,7 @@ def make_connection(
     if connection_type is not None and command != 'refresh':
         _params['connectionType'] = connection_type
 
-    _request = {'id': _id, 'jsonrpc': '2.0', 'method': 'controlDevice', 'params': _params}
-
-    return _request
+    return {**_template, 'params': _params}
 
 
 def query_headset(headset_id: str | None = None, *, include_flex_mappings: bool = False) -> BaseRequest:
@@ -111,9 +147,32 @@ def query_headset(headset_id: str | None = None, *, include_flex_mappings: bool
     if include_flex_mappings:
         _params['includeFlexMappings'] = include_flex_mappings
 
-    _query = {'id': HeadsetID.QUERY_HEADSET, 'jsonrpc': '2.0', 'method': 'queryHeadsets', 'params': _params}
+    return {**_QUERY_HEADSET, 'params': _params}
+
 
-    return _query
+@lru_cache(maxsize=128)
+def encode_query_headset(headset_id: str | None = None, *, include_flex_mappings: bool = False) -> bytes:
+    """Query the headset, encoded as compact JSON.
+
+    Notes:
+        A client queries the same headset over and over, so the encoded requests
+        are kept in an LRU cache of the last 128 distinct arguments, instead of
+        building and serializing a dict on every query. The cached bytes are
+        shared between callers and immutable.
+
+    Args:
+        headset_id (str, optional): The headset ID or wildcard.
+
+    Keyword Args:
+        include_flex_mappings (bool, optional): Include the mappings of EPOCFLEX headset.
+
+    Returns:
+        bytes: The encoded `query_headset` request, ready to be sent over the websocket.
+
+    """
+    _encoded: bytes = to_bytes(query_headset(headset_id, include_flex_mappings=include_flex_mappings))
+
+    return _encoded
 
 
 def update_headset(auth: str, headset_id: str, settings: Setting) -> UpdateHeadsetRequest:
@@ -137,20 +196,13 @@ def update_headset(auth: str, headset_id: str, settings: Setting) -> UpdateHeads
     if settings['mode'] == 'EPOC' and settings['memsRate'] != 0:
         raise ValueError('EPOC headset only supports 0Hz MEMS rate.')
 
-    if settings['mode'] == 'EPOCPLUS' and settings['eegRate'] not in (128, 256):
+    if settings['mode'] == 'EPOCPLUS' and settings['eegRate'] not in _EPOCPLUS_EEG_RATES:
         raise ValueError('EPOCPLUS headset only supports 128Hz or 256Hz EEG rate.')
 
-    if settings['mode'] == 'EPOCPLUS' and settings['memsRate'] not in (0, 32, 64, 128):
+    if settings['mode'] == 'EPOCPLUS' and settings['memsRate'] not in _EPOCPLUS_MEMS_RATES:
         raise ValueError('EPOCPLUS headset only supports 0Hz, 32Hz, 64Hz, or 128Hz MEMS rate.')
 
-    _request = {
-        'id': HeadsetID.UPDATE_HEADSET,
-        'jsonrpc': '2.0',
-        'method': 'updateHeadset',
-        'params': {'cortexToken': auth, 'headset': headset_id, 'setting': settings},
-    }
-
-    return _request
+    return {**_UPDATE_HEADSET, 'params': {'cortexToken': auth, 'headset': headset_id, 'setting': settings}}
 
 
 def update_custom_info(auth: str, headset_id: str, headband_position: Literal['back', 'top']) -> BaseRequest:
@@ -168,18 +220,14 @@ def update_custom_info(auth: str, headset_id: str, headband_position: Literal['b
         BaseRequest: The headset custom information status.
 
     """
-    if headband_position not in ('back', 'top'):
+    if headband_position not in _HEADBAND_POSITIONS:
         raise ValueError('headband_position must be either "back" or "top".')
 
-    _request = {
-        'id': HeadsetID.UPDATE_CUSTOM_INFO,
-        'jsonrpc': '2.0',
-        'method': 'updateHeadsetCustomInfo',
+    return {
+        **_UPDATE_CUSTOM_INFO,
         'params': {'cortexToken': auth, 'headsetId': headset_id, 'headbandPosition': headband_position},
     }
 
-    return _request
-
 
 def sync_with_clock(headset_id: str, monotonic_time: float, system_time: float) -> SyncWithClockRequest:
     """Sync the headset with the system clock.
@@ -196,15 +244,11 @@ def sync_with_clock(headset_id: str, monotonic_time: float, system_time: float)
         SyncWithClockRequest: The headset sync status.
 
     """
-    _request = {
-        'id': HeadsetID.SYNC_WITH_CLOCK,
-        'jsonrpc': '2.0',
-        'method': 'syncWithHeadsetClock',
+    return {
+        **_SYNC_WITH_CLOCK,
         'params': {'headset': headset_id, 'monotonicTime': monotonic_time, 'systemTime': system_time},
     }
 
-    return _request
-
 
 def subscription(
     auth: str, session_id: str, streams: list[str], method: Literal['subscribe', 'unsubscribe']
@@ -226,14 +270,9 @@ def subscription(
         SubscriptionRequest: The subscription status request.
 
     """
-    if method not in ('subscribe', 'unsubscribe'):
+    if method not in _SUBSCRIPTION_METHODS:
         raise ValueError('method must be either "subscribe" or "unsubscribe".')
 
-    _request = {
-        'id': HeadsetID.SUBSCRIBE if method == 'subscribe' else HeadsetID.UNSUBSCRIBE,
-        'jsonrpc': '2.0',
-        'method': method,
-        'params': {'cortexToken': auth, 'session': session_id, 'streams': streams},
-    }
+    _template = _SUBSCRIBE if method == 'subscribe' else _UNSUBSCRIBE
 
-    return _request
+    return {**_template, 'params': {'cortexToken': auth, 'session': session_id, 'streams': streams}}
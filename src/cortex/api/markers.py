@@ -22,11 +22,15 @@ There are two types of markers:
 """
 
 from collections.abc import Mapping
-from typing import Any
+from typing import Any, Final
 
 from cortex.api.id import MarkersID
 from cortex.api.types import MarkerRequest
 
+# Markers can be injected at the rate of the data streams, so the IDs are plain ints.
+_INJECT_MARKER: Final[Mapping[str, Any]] = {'id': int(MarkersID.INJECT), 'jsonrpc': '2.0', 'method': 'injectMarker'}
+_UPDATE_MARKER: Final[Mapping[str, Any]] = {'id': int(MarkersID.UPDATE), 'jsonrpc': '2.0', 'method': 'updateMarker'}
+
 
 def inject_marker(
     auth: str,
@@ -75,9 +79,7 @@ def inject_marker(
     if extras is not None:
         _params['extras'] = extras
 
-    _marker = {'id': MarkersID.INJECT, 'jsonrpc': '2.0', 'method': 'injectMarker', 'params': _params}
-
-    return _marker
+    return {**_INJECT_MARKER, 'params': _params}
 
 
 def update_marker(
@@ -106,6 +108,4 @@ def update_marker(
     if extras is not None:
         _params['extras'] = extras
 
-    _marker = {'id': MarkersID.UPDATE, 'jsonrpc': '2.0', 'method': 'updateMarker', 'params': _params}
-
-    return _marker
+    return {**_UPDATE_MARKER, 'params': _params}
@@ -8,11 +8,46 @@ commands.
 
 # mypy: disable-error-code=assignment
 
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal
 
 from cortex.api.id import MentalCommandID
 from cortex.api.types import BaseRequest, MentalCommandActionRequest
 
+_SET_ACTIVE_ACTION: Final[Mapping[str, Any]] = {
+    'id': int(MentalCommandID.SET_ACTIVE_ACTION),
+    'jsonrpc': '2.0',
+    'method': 'mentalCommandActiveAction',
+}
+_GET_ACTIVE_ACTION: Final[Mapping[str, Any]] = {
+    'id': int(MentalCommandID.GET_ACTIVE_ACTION),
+    'jsonrpc': '2.0',
+    'method': 'mentalCommandActiveAction',
+}
+_BRAIN_MAP: Final[Mapping[str, Any]] = {
+    'id': int(MentalCommandID.BRAIN_MAP),
+    'jsonrpc': '2.0',
+    'method': 'mentalCommandBrainMap',
+}
+_SKILL_RATING: Final[Mapping[str, Any]] = {
+    'id': int(MentalCommandID.SKILL_RATING),
+    'jsonrpc': '2.0',
+    'method': 'mentalCommandGetSkillRating',
+}
+_TRAINING_THRESHOLD: Final[Mapping[str, Any]] = {
+    'id': int(MentalCommandID.TRAINING_THRESHOLD),
+    'jsonrpc': '2.0',
+    'method': 'mentalCommandTrainingThreshold',
+}
+_ACTION_SENSITIVITY: Final[Mapping[str, Any]] = {
+    'id': int(MentalCommandID.ACTION_SENSITIVITY),
+    'jsonrpc': '2.0',
+    'method': 'mentalCommandActionSensitivity',
+}
+
+# Valid statuses of `mentalCommandActiveAction` and `mentalCommandActionSensitivity`.
+_STATUSES: Final[frozenset[str]] = frozenset(('set', 'get'))
+
 
 def active_action(
     auth: str,
@@ -46,16 +81,14 @@ def active_action(
         MentalCommandActionRequest: The active mental command action.
 
     """
-    if status not in ('set', 'get'):
+    if status not in _STATUSES:
         raise ValueError('status must be either "set" or "get".')
 
-    _params = {'cortexToken': auth, 'status': status}
-
     # Either profile_name or session_id must be provided, not both at the same time.
     if profile_name is not None and session_id is None:
-        _params['profile'] = profile_name
+        _params = {'cortexToken': auth, 'status': status, 'profile': profile_name}
     elif session_id is not None and profile_name is None:
-        _params['session'] = session_id
+        _params = {'cortexToken': auth, 'status': status, 'session': session_id}
     else:
         raise AttributeError('Either profile_name or session_id must be provided, not both at the same time.')
 
@@ -64,14 +97,9 @@ def active_action(
             raise ValueError('You can have at most 4 actions.')
         _params['actions'] = actions
 
-    _action = {
-        'id': MentalCommandID.SET_ACTIVE_ACTION if status == 'set' else MentalCommandID.GET_ACTIVE_ACTION,
-        'jsonrpc': '2.0',
-        'method': 'mentalCommandActiveAction',
-        'params': _params,
-    }
+    _template = _SET_ACTIVE_ACTION if status == 'set' else _GET_ACTIVE_ACTION
 
-    return _action
+    return {**_template, 'params': _params}
 
 
 def brain_map(auth: str, *, session_id: str | None = None, profile_name: str | None = None) -> BaseRequest:
@@ -91,23 +119,15 @@ def brain_map(auth: str, *, session_id: str | None = None, profile_name: str | N
         BaseRequest: The mental command brain map.
 
     """
-    _params = {'cortexToken': auth}
-
     # Either profile_name or session_id must be provided, not both at the same time.
     if profile_name is not None and session_id is None:
-        _params['profile'] = profile_name
+        _params = {'cortexToken': auth, 'profile': profile_name}
     elif session_id is not None and profile_name is None:
-        _params['session'] = session_id
+        _params = {'cortexToken': auth, 'session': session_id}
     else:
         raise AttributeError('Either profile_name or session_id must be provided, not both at the same time.')
 
-    _brain_map = {
-        'id': MentalCommandID.BRAIN_MAP,
-        'jsonrpc': '2.0',
-        'method': 'mentalCommandBrainMap',
-        'params': _params,
-    }
-    return _brain_map
+    return {**_BRAIN_MAP, 'params': _params}
 
 
 def get_skill_rating(
@@ -130,27 +150,18 @@ def get_skill_rating(
         BaseRequest: The skill rating of the mental command action.
 
     """
-    _params = {'cortexToken': auth}
-
     # Either profile_name or session_id must be provided, not both at the same time.
     if profile_name is not None and session_id is None:
-        _params['profile'] = profile_name
+        _params = {'cortexToken': auth, 'profile': profile_name}
     elif session_id is not None and profile_name is None:
-        _params['session'] = session_id
+        _params = {'cortexToken': auth, 'session': session_id}
     else:
         raise AttributeError('Either profile_name or session_id must be provided, not both at the same time.')
 
     if action is not None:
         _params['action'] = action
 
-    skill_rating = {
-        'id': MentalCommandID.SKILL_RATING,
-        'jsonrpc': '2.0',
-        'method': 'mentalCommandGetSkillRating',
-        'params': _params,
-    }
-
-    return skill_rating
+    return {**_SKILL_RATING, 'params': _params}
 
 
 def training_threshold(auth: str, *, profile_name: str | None = None, session_id: str | None = None) -> BaseRequest:
@@ -171,24 +182,15 @@ def training_threshold(auth: str, *, profile_name: str | None = None, session_id
             The training threshold for mental commands.
 
     """
-    _params = {'cortexToken': auth}
-
     # Either profile_name or session_id must be provided, not both at the same time.
     if profile_name is not None and session_id is None:
-        _params['profile'] = profile_name
+        _params = {'cortexToken': auth, 'profile': profile_name}
     elif session_id is not None and profile_name is None:
-        _params['session'] = session_id
+        _params = {'cortexToken': auth, 'session': session_id}
     else:
         raise AttributeError('Either profile_name or session_id must be provided, not both at the same time.')
 
-    threshold = {
-        'id': MentalCommandID.TRAINING_THRESHOLD,
-        'jsonrpc': '2.0',
-        'method': 'mentalCommandTrainingThreshold',
-        'params': _params,
-    }
-
-    return threshold
+    return {**_TRAINING_THRESHOLD, 'params': _params}
 
 
 def action_sensitivity(
@@ -223,16 +225,14 @@ def action_sensitivity(
         MentalCommandActionRequest: The mental command action sensitivity.
 
     """
-    if status not in ('set', 'get'):
+    if status not in _STATUSES:
         raise ValueError('status must be either "set" or "get".')
 
-    _params = {'cortexToken': auth, 'status': status}
-
     # Either profile_name or session_id must be provided, not both at the same time.
     if profile_name is not None and session_id is None:
-        _params['profile'] = profile_name
+        _params = {'cortexToken': auth, 'status': status, 'profile': profile_name}
     elif session_id is not None and profile_name is None:
-        _params['session'] = session_id
+        _params = {'cortexToken': auth, 'status': status, 'session': session_id}
     else:
         raise AttributeError('Either profile_name or session_id must be provided, not both at the same time.')
 
@@ -242,11 +242,4 @@ def action_sensitivity(
         else:
             raise ValueError('values must be between 1 and 10.')
 
-    sensitivity = {
-        'id': MentalCommandID.ACTION_SENSITIVITY,
-        'jsonrpc': '2.0',
-        'method': 'mentalCommandActionSensitivity',
-        'params': _params,
-    }
-
-    return sensitivity
+    return {**_ACTION_SENSITIVITY, 'params': _params}
@@ -13,10 +13,32 @@ to load or unload a profile for a headset. You can use training_ to add training
 
 """
 
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal, get_args
 
 from cortex.api.id import ProfileID
-from cortex.api.types import BaseRequest
+from cortex.api.types import BaseRequest, ProfileStatus
+
+_QUERY_PROFILE: Final[Mapping[str, Any]] = {'id': int(ProfileID.QUERY), 'jsonrpc': '2.0', 'method': 'queryProfile'}
+_CURRENT_PROFILE: Final[Mapping[str, Any]] = {
+    'id': int(ProfileID.CURRENT),
+    'jsonrpc': '2.0',
+    'method': 'getCurrentProfile',
+}
+_SETUP_PROFILE: Final[Mapping[str, Any]] = {'id': int(ProfileID.SETUP), 'jsonrpc': '2.0', 'method': 'setupProfile'}
+_LOAD_GUEST: Final[Mapping[str, Any]] = {'id': int(ProfileID.GUEST), 'jsonrpc': '2.0', 'method': 'loadGuestProfile'}
+_DETECTION_INFO: Final[Mapping[str, Any]] = {
+    'id': int(ProfileID.DETECTION_INFO),
+    'jsonrpc': '2.0',
+    'method': 'getDetectionInfo',
+}
+
+# Valid statuses of `setupProfile`, and the ones that apply to a headset.
+_PROFILE_STATUSES: Final[frozenset[str]] = frozenset(get_args(ProfileStatus))
+_HEADSET_STATUSES: Final[frozenset[str]] = frozenset(('create', 'load', 'unload', 'save'))
+
+# Valid detections of `getDetectionInfo`.
+_DETECTIONS: Final[frozenset[str]] = frozenset(('mentalCommand', 'facialExpression'))
 
 
 def query_profile(auth: str) -> BaseRequest:
@@ -29,9 +51,7 @@ def query_profile(auth: str) -> BaseRequest:
         BaseRequest: The query profile request.
 
     """
-    _query = {'id': ProfileID.QUERY, 'jsonrpc': '2.0', 'method': 'queryProfile', 'params': {'cortexToken': auth}}
-
-    return _query
+    return {**_QUERY_PROFILE, 'params': {'cortexToken': auth}}
 
 
 def current_profile(auth: str, headset_id: str) -> BaseRequest:
@@ -48,19 +68,12 @@ def current_profile(auth: str, headset_id: str) -> BaseRequest:
         BaseRequest: The current profile status.
 
     """
-    _profile = {
-        'id': ProfileID.CURRENT,
-        'jsonrpc': '2.0',
-        'method': 'getCurrentProfile',
-        'params': {'cortexToken': auth, 'headset': headset_id},
-    }
-
-    return _profile
+    return {**_CURRENT_PROFILE, 'params': {'cortexToken': auth, 'headset': headset_id}}
 
 
 def setup_profile(
     auth: str,
-    status: Literal['create', 'load', 'unload', 'save', 'rename', 'delete'],
+    status: ProfileStatus,
     profile_name: str,
     *,
     headset_id: str | None = None,
@@ -70,7 +83,8 @@ def setup_profile(
 
     Args:
         auth (str): The Cortex authentication token.
-        status (Literal['create', 'load', 'unload', 'save', 'rename', 'delete']): The profile status.
+        status (ProfileStatus): The profile status, one of 'create', 'load', 'unload',
+            'save', 'rename' or 'delete'.
         profile_name (str): The profile name.
 
     Keyword Args:
@@ -84,26 +98,24 @@ def setup_profile(
         BaseRequest: The profile setup status.
 
     """
-    if status not in ('create', 'load', 'unload', 'save', 'rename', 'delete'):
+    if status not in _PROFILE_STATUSES:
         raise ValueError('status must be one of create, load, unload, save, rename, delete.')
 
     if status == 'rename' and new_profile_name is None:
         raise ValueError('new_profile_name must be provided when status is "rename".')
 
-    if status in ('create', 'load', 'unload', 'save') and headset_id is None:
+    if status in _HEADSET_STATUSES and headset_id is None:
         raise ValueError('headset_id must be provided when status is "create", "load", "unload", or "save".')
 
     _params = {'cortexToken': auth, 'status': status, 'profile': profile_name}
 
-    if headset_id is not None and status in ('create', 'load', 'unload', 'save'):
+    if headset_id is not None and status in _HEADSET_STATUSES:
         _params['headset'] = headset_id
 
     if new_profile_name is not None and status == 'rename':
         _params['newProfileName'] = new_profile_name
 
-    _profile = {'id': ProfileID.SETUP, 'jsonrpc': '2.0', 'method': 'setupProfile', 'params': _params}
-
-    return _profile
+    return {**_SETUP_PROFILE, 'params': _params}
 
 
 def load_guest(auth: str, headset_id: str) -> BaseRequest:
@@ -120,14 +132,7 @@ def load_guest(auth: str, headset_id: str) -> BaseRequest:
         BaseRequest: The guest profile status.
 
     """
-    _guest = {
-        'id': ProfileID.GUEST,
-        'jsonrpc': '2.0',
-        'method': 'loadGuestProfile',
-        'params': {'cortexToken': auth, 'headset': headset_id},
-    }
-
-    return _guest
+    return {**_LOAD_GUEST, 'params': {'cortexToken': auth, 'headset': headset_id}}
 
 
 def detection_info(detection: Literal['mentalCommand', 'facialExpression']) -> BaseRequest:
@@ -143,14 +148,7 @@ def detection_info(detection: Literal['mentalCommand', 'facialExpression']) -> B
         BaseRequest: The detection information.
 
     """
-    if detection not in ('mentalCommand', 'facialExpression'):
+    if detection not in _DETECTIONS:
         raise ValueError('detection must be either "mentalCommand" or "facialExpression".')
 
-    _detection = {
-        'id': ProfileID.DETECTION_INFO,
-        'jsonrpc': '2.0',
-        'method': 'getDetectionInfo',
-        'params': {'detection': detection},
-    }
-
-    return _detection
+    return {**_DETECTION_INFO, 'params': {'detection': detection}}
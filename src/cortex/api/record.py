@@ -6,6 +6,9 @@ an EMOTIV headset. You can associate a subject_ to a record. You can add one or
 Unlike a session_, a record is a permanent object. It is stored on the hard drive and then can be synchronized to the
 EMOTIV cloud. The `opt-out`_ configuration can let you decide if the records of a user are uploaded to the cloud or not.
 
+The sequences passed to the builders (record IDs, tags, ...) are copied into tuples, so a request can't be changed by
+mutating the caller's list after it has been built.
+
 .. _Records: https://emotiv.gitbook.io/cortex-api/records
 .. _session: https://emotiv.gitbook.io/cortex-api/session
 .. _subject: https://emotiv.gitbook.io/cortex-api/subjects
@@ -14,10 +17,10 @@ EMOTIV cloud. The `opt-out`_ configuration can let you decide if the records of
 
 """
 
-# mypy: disable-error-code="assignment"
-
-from typing import Literal
+from collections.abc import Mapping, Sequence
+from typing import Any, Final, Literal, get_args
 
+from cortex.api.batch import batch
 from cortex.api.id import RecordsID
 from cortex.api.types import (
     BaseRequest,
@@ -25,6 +28,7 @@ from cortex.api.types import (
     CreateRecordRequest,
     DeleteRecordRequest,
     DownloadRecordDataRequest,
+    ExportFormat,
     ExportRecordRequest,
     QueryRecordRequest,
     RecordInfoRequest,
@@ -32,6 +36,58 @@ from cortex.api.types import (
     UpdateRecordRequest,
 )
 
+# The members shared by every JSON-RPC request envelope.
+_JSONRPC: Final[Mapping[str, str]] = {'jsonrpc': '2.0'}
+
+
+def _template(request_id: RecordsID, method: str) -> Mapping[str, Any]:
+    """Build the JSON-RPC skeleton of a request.
+
+    Args:
+        request_id (RecordsID): The request ID. It is stored as a plain int, so
+            serializers never dispatch on IntEnum.
+        method (str): The Cortex API method.
+
+    Returns:
+        Mapping[str, Any]: The `id`, `jsonrpc` and `method` of the request.
+
+    """
+    return {'id': int(request_id), **_JSONRPC, 'method': method}
+
+
+_CREATE_RECORD: Final = _template(RecordsID.CREATE, 'createRecord')
+_STOP_RECORD: Final = _template(RecordsID.STOP, 'stopRecord')
+_UPDATE_RECORD: Final = _template(RecordsID.UPDATE, 'updateRecord')
+_DELETE_RECORD: Final = _template(RecordsID.DELETE, 'deleteRecord')
+_EXPORT_RECORD: Final = _template(RecordsID.EXPORT, 'exportRecord')
+_QUERY_RECORDS: Final = _template(RecordsID.QUERY, 'queryRecords')
+_RECORD_INFOS: Final = _template(RecordsID.INFO, 'getRecordInfos')
+_CONFIG_OPT_OUT: Final = _template(RecordsID.CONFIG_OPT_OUT, 'configOptOut')
+_DOWNLOAD_RECORD_DATA: Final = _template(RecordsID.DOWNLOAD_DATA, 'requestToDownloadRecordData')
+
+# Valid values of the `format` of `exportRecord` and the `status` of `configOptOut`.
+_EXPORT_FORMATS: Final[frozenset[str]] = frozenset(get_args(ExportFormat))
+_OPT_OUT_STATUSES: Final[frozenset[str]] = frozenset(('get', 'set'))
+
+
+def _request(template: Mapping[str, Any], params: Mapping[str, Any]) -> dict[str, Any]:
+    """Build a JSON-RPC request from a request skeleton.
+
+    Args:
+        template (Mapping[str, Any]): The `id`, `jsonrpc` and `method` of the request.
+        params (Mapping[str, Any]): The request params.
+
+    Notes:
+        Builders with a fixed set of params (`stop_record`, `delete_record`,
+        `record_infos` and `download_record_data`) inline this merge instead,
+        saving a function call per request.
+
+    Returns:
+        dict[str, Any]: A new request, which the caller is free to mutate.
+
+    """
+    return {**template, 'params': params}
+
 
 def create_record(
     auth: str,
@@ -40,7 +96,7 @@ def create_record(
     *,
     description: str | None = None,
     subject_name: str | None = None,
-    tags: list[str] | None = None,
+    tags: Sequence[str] | None = None,
     experiment_id: int | None = None,
 ) -> CreateRecordRequest:
     """Create a record.
@@ -53,7 +109,7 @@ def create_record(
     Keyword Args:
         description (str, optional): The record description.
         subject_name (str, optional): The subject name.
-        tags (list[str], optional): The record tags.
+        tags (Sequence[str], optional): The record tags.
         experiment_id (int, optional): The experiment ID.
 
     Read More:
@@ -63,23 +119,46 @@ def create_record(
         CreateRecordRequest: The record creation status.
 
     """
-    _params = {'cortexToken': auth, 'session': session_id, 'title': title}
+    _params: dict[str, Any] = {'cortexToken': auth, 'session': session_id, 'title': title}
+
+    for key, value in (
+        ('description', description),
+        ('subjectName', subject_name),
+        ('tags', None if tags is None else tuple(tags)),
+        ('experimentId', experiment_id),
+    ):
+        if value is not None:
+            _params[key] = value
+
+    return _request(_CREATE_RECORD, _params)
 
-    if description is not None:
-        _params['description'] = description
 
-    if subject_name is not None:
-        _params['subjectName'] = subject_name
+def create_records_batch(auth: str, items: Sequence[Mapping[str, Any]]) -> list[CreateRecordRequest]:
+    """Create several records with a single JSON-RPC batch.
+
+    Notes:
+        The returned list is a JSON-RPC 2.0 batch (see `cortex.api.batch`).
+        Serialize and send it as a single websocket frame instead of sending
+        each request on its own. Every request gets its own ID, from which
+        `cortex.api.batch.original_id` recovers the `createRecord` ID.
+        `Headset` uses it to handle each response like the one of `create_record`;
+        otherwise, match the responses with `cortex.api.batch.split_batch_response`.
+
+    Args:
+        auth (str): The Cortex authentication token.
+        items (Sequence[Mapping[str, Any]]): The arguments of each record, i.e.
+            `session_id`, `title` and any keyword argument of `create_record`.
 
-    if tags is not None:
-        _params['tags'] = tags
+    Read More:
+        [JSON-RPC batch](https://www.jsonrpc.org/specification#batch)
 
-    if experiment_id is not None:
-        _params['experimentId'] = experiment_id
+    Returns:
+        list[CreateRecordRequest]: The record creation requests, each with a unique ID.
 
-    _record = {'id': RecordsID.CREATE, 'jsonrpc': '2.0', 'method': 'createRecord', 'params': _params}
+    """
+    _batch: list[CreateRecordRequest] = batch(create_record(auth, **item) for item in items)
 
-    return _record
+    return _batch
 
 
 def stop_record(auth: str, session_id: str) -> BaseRequest:
@@ -96,14 +175,7 @@ def stop_record(auth: str, session_id: str) -> BaseRequest:
         BaseRequest: The record stop status.
 
     """
-    _record = {
-        'id': RecordsID.STOP,
-        'jsonrpc': '2.0',
-        'method': 'stopRecord',
-        'params': {'cortexToken': auth, 'session': session_id},
-    }
-
-    return _record
+    return {**_STOP_RECORD, 'params': {'cortexToken': auth, 'session': session_id}}
 
 
 def update_record(
@@ -112,7 +184,7 @@ def update_record(
     *,
     title: str | None = None,
     description: str | None = None,
-    tags: list[str] | None = None,
+    tags: Sequence[str] | None = None,
 ) -> UpdateRecordRequest:
     """Update the record.
 
@@ -123,7 +195,7 @@ def update_record(
     Keyword Args:
         title (str, optional): The record title.
         description (str, optional): The record description.
-        tags (list[str], optional): The new tags of the record.
+        tags (Sequence[str], optional): The new tags of the record.
 
     Read More:
         [updateRecord](https://emotiv.gitbook.io/cortex-api/records/updaterecord)
@@ -132,28 +204,21 @@ def update_record(
         UpdateRecordRequest: The record update status.
 
     """
-    _params = {'cortexToken': auth, 'record': record_id}
-
-    if title is not None:
-        _params['title'] = title
+    _params: dict[str, Any] = {'cortexToken': auth, 'record': record_id}
 
-    if description is not None:
-        _params['description'] = description
+    for key, value in (('title', title), ('description', description), ('tags', None if tags is None else tuple(tags))):
+        if value is not None:
+            _params[key] = value
 
-    if tags is not None:
-        _params['tags'] = tags
+    return _request(_UPDATE_RECORD, _params)
 
-    _record = {'id': RecordsID.UPDATE, 'jsonrpc': '2.0', 'method': 'updateRecord', 'params': _params}
 
-    return _record
-
-
-def delete_record(auth: str, records: list[str]) -> DeleteRecordRequest:
+def delete_record(auth: str, records: Sequence[str]) -> DeleteRecordRequest:
     """Delete a record.
 
     Args:
         auth (str): The Cortex authentication token.
-        records (list[str]): The record IDs.
+        records (Sequence[str]): The record IDs.
 
     Read More:
         [deleteRecord](https://emotiv.gitbook.io/cortex-api/records/deleterecord)
@@ -162,26 +227,19 @@ def delete_record(auth: str, records: list[str]) -> DeleteRecordRequest:
         DeleteRecordRequest: The record deletion status.
 
     """
-    _record = {
-        'id': RecordsID.DELETE,
-        'jsonrpc': '2.0',
-        'method': 'deleteRecord',
-        'params': {'cortexToken': auth, 'records': records},
-    }
-
-    return _record
+    return {**_DELETE_RECORD, 'params': {'cortexToken': auth, 'records': tuple(records)}}
 
 
 def export_record(
     auth: str,
-    record_ids: list[str],
+    record_ids: Sequence[str],
     folder: str,
-    stream_types: list[str],
+    stream_types: Sequence[str],
     # pylint: disable-next=redefined-builtin
-    format: Literal['EDF', 'EDFPLUS', 'BDFPLUS', 'CSV'],
+    format: ExportFormat,
     *,
     version: Literal['V1', 'V2'] | None = None,
-    license_ids: list[str] | None = None,
+    license_ids: Sequence[str] | None = None,
     include_demographics: bool = False,
     include_survey: bool = False,
     include_marker_extra_infos: bool = False,
@@ -191,17 +249,17 @@ def export_record(
 
     Args:
         auth (str): The Cortex authentication token.
-        record_ids (list[str]): The record IDs.
+        record_ids (Sequence[str]): The record IDs.
         folder (str): The path of a local folder.
-        stream_types (list[str]): List of the data streams you want to export.
-        format (Literal['EDF' 'EDFPLUS', 'BDFPLUS', 'CSV']): The format of the
-             exported files.
+        stream_types (Sequence[str]): List of the data streams you want to export.
+        format (ExportFormat): The format of the exported files, one of
+             'EDF', 'EDFPLUS', 'BDFPLUS' or 'CSV'.
 
     Keyword Args:
         version (Literal['V1', 'V2']): The version of the CSV format.
              If the format is "EDF", then you must omit this parameter.
              If the format is "CSV", then this parameter must be "V1" or "V2".
-        license_ids (list[str], optional): The default value is an empty list,
+        license_ids (Sequence[str], optional): The default value is an empty list,
              which means that you can only export the records created by your app.
         include_demographics (bool, optional): If `true` the the exported JSON
              file will include the demographic data of the user.
@@ -219,38 +277,37 @@ def export_record(
         ExportRecordRequest: The record export status.
 
     """
-    if format not in {'EDF', 'EDFPLUS', 'BDFPLUS', 'CSV'}:
+    if format not in _EXPORT_FORMATS:
         raise ValueError('format must be either "EDF", "EDFPLUS", "BDFPLUS", or "CSV".')
 
-    _params = {
+    _params: dict[str, Any] = {
         'cortexToken': auth,
-        'recordIds': record_ids,
+        'recordIds': tuple(record_ids),
         'folder': folder,
-        'streamTypes': stream_types,
+        'streamTypes': tuple(stream_types),
         'format': format,
     }
 
+    # Bind the setter once, it's used by every optional param below.
+    _set = _params.__setitem__
+
     if format == 'CSV' and version is not None:
-        _params['version'] = version
+        _set('version', version)
 
     if license_ids is not None:
-        _params['licenseIds'] = license_ids
-
-    if include_demographics:
-        _params['includeDemographics'] = include_demographics
-
-    if include_survey:
-        _params['includeSurvey'] = include_survey
+        _set('licenseIds', tuple(license_ids))
 
-    if include_marker_extra_infos:
-        _params['includeMarkerExtraInfos'] = include_marker_extra_infos
+    # Boolean flags are only sent when they are set.
+    for key, flag in (
+        ('includeDemographics', include_demographics),
+        ('includeSurvey', include_survey),
+        ('includeMarkerExtraInfos', include_marker_extra_infos),
+        ('includeDeprecatedPM', include_deprecated_pm),
+    ):
+        if flag:
+            _set(key, flag)
 
-    if include_deprecated_pm:
-        _params['includeDeprecatedPM'] = include_deprecated_pm
-
-    _record = {'id': RecordsID.EXPORT, 'jsonrpc': '2.0', 'method': 'exportRecord', 'params': _params}
-
-    return _record
+    return _request(_EXPORT_RECORD, _params)
 
 
 def query_records(
@@ -273,7 +330,7 @@ def query_records(
 
     Keyword Args:
         limit (int, optional): The maximum number of records to return.
-        offset (int, optional): The number of records to skip.
+        offset (int, optional): The number of records to skip. Requires `limit`.
         include_markers (bool, optional): If `true` then the markers of the records
             will be included in the response.
         include_sync_status_info (bool, optional): If `true` then the synchronization
@@ -286,33 +343,30 @@ def query_records(
         QuerySubjectRequest: The record query status.
 
     """
-    _params = {'cortexToken': auth, 'query': query, 'orderBy': order_by}
+    if offset is not None and (limit is None or limit < offset):
+        raise ValueError('The offset requires a limit.' if limit is None else 'The offset must be less than the limit.')
+
+    _params: dict[str, Any] = {'cortexToken': auth, 'query': query, 'orderBy': order_by}
 
     if limit is not None:
         _params['limit'] = limit
 
-    if offset is not None and limit is not None:
-        if limit < offset:
-            raise ValueError('The offset must be less than the limit.')
+    if offset is not None:
         _params['offset'] = offset
 
-    if include_markers:
-        _params['includeMarkers'] = include_markers
-
-    if include_sync_status_info:
-        _params['includeSyncStatusInfo'] = include_sync_status_info
+    for key, flag in (('includeMarkers', include_markers), ('includeSyncStatusInfo', include_sync_status_info)):
+        if flag:
+            _params[key] = flag
 
-    _record = {'id': RecordsID.QUERY, 'jsonrpc': '2.0', 'method': 'queryRecords', 'params': _params}
+    return _request(_QUERY_RECORDS, _params)
 
-    return _record
 
-
-def record_infos(auth: str, record_ids: list[str]) -> RecordInfoRequest:
+def record_infos(auth: str, record_ids: Sequence[str]) -> RecordInfoRequest:
     """Get the record information.
 
     Args:
         auth (str): The Cortex authentication token.
-        record_ids (list[str]): The record IDs.
+        record_ids (Sequence[str]): The record IDs.
 
     Read More:
         [getRecordInformation](https://emotiv.gitbook.io/cortex-api/records/getrecordinfos)
@@ -321,14 +375,7 @@ def record_infos(auth: str, record_ids: list[str]) -> RecordInfoRequest:
         RecordInfoRequest: The record information.
 
     """
-    _record = {
-        'id': RecordsID.INFO,
-        'jsonrpc': '2.0',
-        'method': 'getRecordInfos',
-        'params': {'cortexToken': auth, 'recordIds': record_ids},
-    }
-
-    return _record
+    return {**_RECORD_INFOS, 'params': {'cortexToken': auth, 'recordIds': tuple(record_ids)}}
 
 
 def config_opt_out(auth: str, status: Literal['get', 'set'], *, new_opt_out: bool = False) -> ConfigOptOutRequest:
@@ -348,24 +395,22 @@ def config_opt_out(auth: str, status: Literal['get', 'set'], *, new_opt_out: boo
         ConfigOptOutRequest: The opt-out status.
 
     """
-    if status not in {'get', 'set'}:
+    if status not in _OPT_OUT_STATUSES:
         raise ValueError('status must be either "get" or "set".')
 
-    _params = {'cortexToken': auth, 'status': status}
+    _params: dict[str, Any] = {'cortexToken': auth, 'status': status}
     if status == 'set':
         _params['newOptOut'] = new_opt_out
 
-    _record = {'id': RecordsID.CONFIG_OPT_OUT, 'jsonrpc': '2.0', 'method': 'configOptOut', 'params': _params}
+    return _request(_CONFIG_OPT_OUT, _params)
 
-    return _record
 
-
-def download_record_data(auth: str, record_ids: list[str]) -> DownloadRecordDataRequest:
+def download_record_data(auth: str, record_ids: Sequence[str]) -> DownloadRecordDataRequest:
     """Download record data.
 
     Args:
         auth (str): The Cortex authentication token.
-        record_ids (list[str]): The record IDs.
+        record_ids (Sequence[str]): The record IDs.
 
     Read More:
         [requestToDownloadRecordData](https://emotiv.gitbook.io/cortex-api/records/requesttodownloadrecorddata)
@@ -374,11 +419,69 @@ def download_record_data(auth: str, record_ids: list[str]) -> DownloadRecordData
         DownloadRecordDataRequest: The record data.
 
     """
-    _record = {
-        'id': RecordsID.DOWNLOAD_DATA,
-        'jsonrpc': '2.0',
-        'method': 'requestToDownloadRecordData',
-        'params': {'cortexToken': auth, 'recordIds': record_ids},
-    }
+    return {**_DOWNLOAD_RECORD_DATA, 'params': {'cortexToken': auth, 'recordIds': tuple(record_ids)}}
+
+
+class RecordClient:
+    """Build the record requests of a session.
+
+    The authentication token and session ID are given once instead of on every
+    call. The `cortexToken` and `session` params of `stopRecord` are built once
+    and copied for every request.
+
+    """
 
-    return _record
+    __slots__ = ('_base',)
+
+    def __init__(self, auth: str, session_id: str) -> None:
+        """Initialize the client.
+
+        Args:
+            auth (str): The Cortex authentication token.
+            session_id (str): The session ID.
+
+        """
+        self._base: Final[dict[str, Any]] = {'cortexToken': auth, 'session': session_id}
+
+    def create(
+        self,
+        title: str,
+        *,
+        description: str | None = None,
+        subject_name: str | None = None,
+        tags: Sequence[str] | None = None,
+        experiment_id: int | None = None,
+    ) -> CreateRecordRequest:
+        """Create a record in the session. See `create_record`.
+
+        Args:
+            title (str): The record title.
+
+        Keyword Args:
+            description (str, optional): The record description.
+            subject_name (str, optional): The subject name.
+            tags (Sequence[str], optional): The record tags.
+            experiment_id (int, optional): The experiment ID.
+
+        Returns:
+            CreateRecordRequest: The record creation status.
+
+        """
+        return create_record(
+            self._base['cortexToken'],
+            self._base['session'],
+            title,
+            description=description,
+            subject_name=subject_name,
+            tags=tags,
+            experiment_id=experiment_id,
+        )
+
+    def stop(self) -> BaseRequest:
+        """Stop the record of the session. See `stop_record`.
+
+        Returns:
+            BaseRequest: The record stop status.
+
+        """
+        return {**_STOP_RECORD, 'params': self._base.copy()}
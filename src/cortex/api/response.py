@@ -1,5 +1,7 @@
 """Response objects for the Cortex API."""
 
+from __future__ import annotations
+
 from collections.abc import Mapping
 from typing import Literal, TypedDict
 
@@ -45,7 +47,7 @@ class FlexMapping(TypedDict):
     # of EPOC Flex device. The keys are the names of the connectors, the
     # values are the names of the EEG channels.
     # Example: {"CMS": "TP8", "DRL": "P6", "RM": "TP10", "RN": "P4", "RO": "P8"}
-    mappings: Mapping[str, str]
+    mappings: dict[str, str]
 
 
 class UserLoginObject(TypedDict):
@@ -293,7 +295,7 @@ class MarkerObject(TypedDict):
     endDatetime: str
 
     # Can be any extra information you want to associate with this marker.
-    extras: Mapping[str, str]
+    extras: dict[str, str]
 
 
 class DemographicAttribute(TypedDict):
@@ -391,7 +393,7 @@ class RecordsObject(TypedDict, total=False):
     # If the headset is an EPOC X, then this field tells you the position of the
     # headband of this headset during this record. Can be "back" or "top".
     # If the headset is not an EPOC X, then this field is null.
-    headsetPosition: Literal['back', 'top']
+    headsetPosition: Literal['back', 'top'] | None
 
     # The markers added to this record.
     markers: list[MarkerObject] | None
@@ -0,0 +1,93 @@
+"""Serialization of Cortex API requests.
+
+Requests are encoded with [orjson] when it is installed, and with the standard library `json` module otherwise. Both
+produce compact UTF-8 encoded JSON, ready to be sent over the websocket.
+
+[orjson]: https://github.com/ijl/orjson
+
+"""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+
+@dataclass(slots=True, frozen=True)
+class JsonRpcRequest:
+    """A compact JSON-RPC request.
+
+    Stores the envelope of a request in slots rather than in a dict, e.g. to keep
+    many requests around before sending them. It can be passed to `to_bytes` as is.
+
+    Attributes:
+        id (int): The request ID.
+        method (str): The Cortex API method.
+        params (Mapping[str, Any]): The request params.
+        jsonrpc (str): The JSON-RPC version.
+
+    """
+
+    id: int
+    method: str
+    params: Mapping[str, Any]
+    jsonrpc: str = '2.0'
+
+    def to_request(self) -> dict[str, Any]:
+        """Build the JSON-RPC request.
+
+        Returns:
+            dict[str, Any]: The request, as returned by the request builders.
+
+        """
+        return {'id': self.id, 'jsonrpc': self.jsonrpc, 'method': self.method, 'params': self.params}
+
+
+def _default(obj: Any) -> Any:
+    """Encode objects that aren't natively supported by the JSON encoder.
+
+    Args:
+        obj (Any): The object to encode.
+
+    Raises:
+        TypeError: If the object can't be encoded.
+
+    Returns:
+        Any: A JSON serializable version of `obj`.
+
+    """
+    # Compact request objects (e.g. `JsonRpcRequest`).
+    to_request = getattr(obj, 'to_request', None)
+    if callable(to_request):
+        return to_request()
+    # Read-only views (e.g. `types.MappingProxyType`) of frozen requests and params.
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def to_bytes(request: Any) -> bytes:
+    """Serialize a request (or a batch of requests) to JSON.
+
+    Notes:
+        Read-only mappings, such as `types.MappingProxyType`, are encoded as JSON
+        objects, so requests and params can be shared behind a read-only view.
+        Objects with a `to_request()` method are encoded as the request it returns.
+
+    Args:
+        request (Any): The request returned by one of the request builders, or a list of them.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON request.
+
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(request, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(request, separators=(',', ':'), default=_default).encode()
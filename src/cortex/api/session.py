@@ -20,11 +20,31 @@ But it can open multiple sessions with multiple headsets.
 
 """
 
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal
 
 from cortex.api.id import SessionID
+from cortex.api.serialize import to_bytes
 from cortex.api.types import BaseRequest
 
+_ID_CREATE: Final[int] = int(SessionID.CREATE)
+_ID_UPDATE: Final[int] = int(SessionID.UPDATE)
+_ID_QUERY: Final[int] = int(SessionID.QUERY)
+
+_CREATE_SESSION: Final[Mapping[str, Any]] = {'id': _ID_CREATE, 'jsonrpc': '2.0', 'method': 'createSession'}
+_UPDATE_SESSION: Final[Mapping[str, Any]] = {'id': _ID_UPDATE, 'jsonrpc': '2.0', 'method': 'updateSession'}
+_QUERY_SESSION: Final[Mapping[str, Any]] = {'id': _ID_QUERY, 'jsonrpc': '2.0', 'method': 'querySession'}
+
+# Valid statuses of `createSession` and `updateSession`.
+_CREATE_STATUSES: Final[frozenset[str]] = frozenset(('open', 'active'))
+_UPDATE_STATUSES: Final[frozenset[str]] = frozenset(('active', 'close'))
+
+# The encoded `querySession` request, around the (JSON string) authentication token.
+_QUERY_SESSION_PREFIX: Final[bytes] = (
+    f'{{"id":{_ID_QUERY},"jsonrpc":"2.0","method":"querySession","params":{{"cortexToken":'.encode()
+)
+_QUERY_SESSION_SUFFIX: Final[bytes] = b'}}'
+
 
 def create_session(auth: str, headset_id: str, status: Literal['open', 'active']) -> BaseRequest:
     """Either open a session or open and activate a session.
@@ -43,17 +63,10 @@ def create_session(auth: str, headset_id: str, status: Literal['open', 'active']
         BaseRequest: The session status.
 
     """
-    if status not in ('open', 'active'):
+    if status not in _CREATE_STATUSES:
         raise ValueError('status must be either "open" or "active".')
 
-    _session = {
-        'id': SessionID.CREATE,
-        'jsonrpc': '2.0',
-        'method': 'createSession',
-        'params': {'cortexToken': auth, 'headset': headset_id, 'status': status},
-    }
-
-    return _session
+    return {**_CREATE_SESSION, 'params': {'cortexToken': auth, 'headset': headset_id, 'status': status}}
 
 
 def update_session(auth: str, session_id: str, status: Literal['active', 'close']) -> BaseRequest:
@@ -73,17 +86,10 @@ def update_session(auth: str, session_id: str, status: Literal['active', 'close'
         BaseRequest: The session status.
 
     """
-    if status not in ('active', 'close'):
+    if status not in _UPDATE_STATUSES:
         raise ValueError('status must be either "active" or "close".')
 
-    _session = {
-        'id': SessionID.UPDATE,
-        'jsonrpc': '2.0',
-        'method': 'updateSession',
-        'params': {'cortexToken': auth, 'session': session_id, 'status': status},
-    }
-
-    return _session
+    return {**_UPDATE_SESSION, 'params': {'cortexToken': auth, 'session': session_id, 'status': status}}
 
 
 def query_session(auth: str) -> BaseRequest:
@@ -99,6 +105,26 @@ def query_session(auth: str) -> BaseRequest:
         BaseRequest: The session status.
 
     """
-    _session = {'id': SessionID.QUERY, 'jsonrpc': '2.0', 'method': 'querySession', 'params': {'cortexToken': auth}}
+    return {**_QUERY_SESSION, 'params': {'cortexToken': auth}}
+
+
+def encode_query_session(auth: str) -> bytes:
+    """Query the session, encoded as compact JSON.
+
+    Notes:
+        Only the authentication token changes between two `querySession`
+        requests, so it is spliced into the pre-encoded request instead of
+        building and serializing a dict on every poll. Nothing is cached, so
+        no token outlives the call.
+
+    Args:
+        auth (str): The Cortex authentication token.
+
+    Returns:
+        bytes: The encoded `query_session` request, ready to be sent over the websocket.
+
+    """
+    # Encoded with `to_bytes`, like the whole request, so the bytes match the wire format.
+    _token: bytes = to_bytes(auth)
 
-    return _session
+    return _QUERY_SESSION_PREFIX + _token + _QUERY_SESSION_SUFFIX
@@ -16,13 +16,92 @@ You can call querySubjects_ to list the subjects already created for the current
 
 """
 
-# mypy: disable-error-code="assignment"
-
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal
 
 from cortex.api.id import SubjectsID
+from cortex.api.serialize import to_bytes
 from cortex.api.types import Attribute, BaseRequest, QuerySubjectRequest, SubjectQuery, SubjectRequest
 
+_ID_CREATE: Final[int] = int(SubjectsID.CREATE)
+_ID_UPDATE: Final[int] = int(SubjectsID.UPDATE)
+_ID_DELETE: Final[int] = int(SubjectsID.DELETE)
+_ID_QUERY: Final[int] = int(SubjectsID.QUERY)
+_ID_DEMO_ATTR: Final[int] = int(SubjectsID.DEMO_ATTR)
+
+_CREATE_SUBJECT: Final[Mapping[str, Any]] = {'id': _ID_CREATE, 'jsonrpc': '2.0', 'method': 'createSubject'}
+_UPDATE_SUBJECT: Final[Mapping[str, Any]] = {'id': _ID_UPDATE, 'jsonrpc': '2.0', 'method': 'updateSubject'}
+_DELETE_SUBJECT: Final[Mapping[str, Any]] = {'id': _ID_DELETE, 'jsonrpc': '2.0', 'method': 'deleteSubjects'}
+_QUERY_SUBJECTS: Final[Mapping[str, Any]] = {'id': _ID_QUERY, 'jsonrpc': '2.0', 'method': 'querySubjects'}
+_DEMOGRAPHIC_ATTRIBUTES: Final[Mapping[str, Any]] = {
+    'id': _ID_DEMO_ATTR,
+    'jsonrpc': '2.0',
+    'method': 'getDemographicAttributes',
+}
+
+# The encoded `getDemographicAttributes` request, around the (JSON string) authentication token.
+_DEMOGRAPHIC_ATTRIBUTES_PREFIX: Final[bytes] = (
+    f'{{"id":{_ID_DEMO_ATTR},"jsonrpc":"2.0","method":"getDemographicAttributes","params":{{"cortexToken":'.encode()
+)
+_DEMOGRAPHIC_ATTRIBUTES_SUFFIX: Final[bytes] = b'}}'
+
+# Valid values of the `sex` of a subject.
+_SEXES: Final[frozenset[str]] = frozenset(('M', 'F', 'U'))
+
+
+def _subject_write(
+    template: Mapping[str, Any],
+    auth: str,
+    subject_name: str,
+    *,
+    date_of_birth: str | None,
+    sex: Literal['M', 'F', 'U'] | None,
+    country_code: str | None,
+    state: str | None,
+    city: str | None,
+    attributes: list[Attribute] | None,
+) -> SubjectRequest:
+    """Build a `createSubject` or `updateSubject` request.
+
+    Args:
+        template (Mapping[str, Any]): The `id`, `jsonrpc` and `method` of the request.
+        auth (str): The Cortex authentication token.
+        subject_name (str): The subject name.
+
+    Keyword Args:
+        date_of_birth (str, optional): The subject date of birth.
+        sex (Literal['M', 'F', 'U'], optional): The gender of the subject.
+        country_code (str, optional): The subject country code.
+        state (str, optional): The subject state.
+        city (str, optional): The subject city.
+        attributes (list[Attribute], optional): The subject attributes.
+
+    Returns:
+        SubjectRequest: The subject request.
+
+    """
+    if sex is not None and sex not in _SEXES:
+        raise ValueError('sex must be either "M", "F", or "U".')
+
+    _params = {
+        'cortexToken': auth,
+        'subjectName': subject_name,
+        **{
+            key: value
+            for key, value in (
+                ('dateOfBirth', date_of_birth),
+                ('sex', sex),
+                ('countryCode', country_code),
+                ('state', state),
+                ('city', city),
+                ('attributes', attributes),
+            )
+            if value is not None
+        },
+    }
+
+    return {**template, 'params': _params}
+
 
 def create_subject(
     auth: str,
@@ -56,30 +135,17 @@ def create_subject(
         SubjectRequest: The subject creation status.
 
     """
-    _params = {'cortexToken': auth, 'subjectName': subject_name}
-
-    if date_of_birth is not None:
-        _params['dateOfBirth'] = date_of_birth
-
-    if sex is not None:
-        assert sex in {'M', 'F', 'U'}, 'sex must be either "M", "F", or "U".'
-        _params['sex'] = sex
-
-    if country_code is not None:
-        _params['countryCode'] = country_code
-
-    if state is not None:
-        _params['state'] = state
-
-    if city is not None:
-        _params['city'] = city
-
-    if attributes is not None:
-        _params['attributes'] = attributes
-
-    _subject = {'id': SubjectsID.CREATE, 'jsonrpc': '2.0', 'method': 'createSubject', 'params': _params}
-
-    return _subject
+    return _subject_write(
+        _CREATE_SUBJECT,
+        auth,
+        subject_name,
+        date_of_birth=date_of_birth,
+        sex=sex,
+        country_code=country_code,
+        state=state,
+        city=city,
+        attributes=attributes,
+    )
 
 
 def update_subject(
@@ -114,30 +180,17 @@ def update_subject(
         SubjectRequest: The subject update status.
 
     """
-    _params = {'cortexToken': auth, 'subjectName': subject_name}
-
-    if date_of_birth is not None:
-        _params['dateOfBirth'] = date_of_birth
-
-    if sex is not None:
-        assert sex in {'M', 'F', 'U'}, 'sex must be either "M", "F", or "U".'
-        _params['sex'] = sex
-
-    if country_code is not None:
-        _params['countryCode'] = country_code
-
-    if state is not None:
-        _params['state'] = state
-
-    if city is not None:
-        _params['city'] = city
-
-    if attributes is not None:
-        _params['attributes'] = attributes
-
-    _subject = {'id': SubjectsID.UPDATE, 'jsonrpc': '2.0', 'method': 'updateSubject', 'params': _params}
-
-    return _subject
+    return _subject_write(
+        _UPDATE_SUBJECT,
+        auth,
+        subject_name,
+        date_of_birth=date_of_birth,
+        sex=sex,
+        country_code=country_code,
+        state=state,
+        city=city,
+        attributes=attributes,
+    )
 
 
 def delete_subject(auth: str, subject_name: str) -> BaseRequest:
@@ -154,14 +207,7 @@ def delete_subject(auth: str, subject_name: str) -> BaseRequest:
         BaseRequest: The subject deletion status.
 
     """
-    _subject = {
-        'id': SubjectsID.DELETE,
-        'jsonrpc': '2.0',
-        'method': 'deleteSubjects',
-        'params': {'cortexToken': auth, 'subjectName': subject_name},
-    }
-
-    return _subject
+    return {**_DELETE_SUBJECT, 'params': {'cortexToken': auth, 'subjectName': subject_name}}
 
 
 def query_subject(
@@ -201,9 +247,7 @@ def query_subject(
             raise ValueError('offset must be less than limit.')
         _params['offset'] = offset
 
-    _subject = {'id': SubjectsID.QUERY, 'jsonrpc': '2.0', 'method': 'querySubjects', 'params': _params}
-
-    return _subject
+    return {**_QUERY_SUBJECTS, 'params': _params}
 
 
 def get_demographic_attr(auth: str) -> BaseRequest:
@@ -219,11 +263,25 @@ def get_demographic_attr(auth: str) -> BaseRequest:
         BaseRequest: The demographic attributes.
 
     """
-    _subject = {
-        'id': SubjectsID.DEMO_ATTR,
-        'jsonrpc': '2.0',
-        'method': 'getDemographicAttributes',
-        'params': {'cortexToken': auth},
-    }
+    return {**_DEMOGRAPHIC_ATTRIBUTES, 'params': {'cortexToken': auth}}
+
+
+def encode_demographic_attr(auth: str) -> bytes:
+    """Get the demographic attributes, encoded as compact JSON.
+
+    Notes:
+        Only the authentication token changes between two `getDemographicAttributes`
+        requests, so it is spliced into the pre-encoded request. Nothing is cached,
+        so no token outlives the call.
+
+    Args:
+        auth (str): The Cortex authentication token.
+
+    Returns:
+        bytes: The encoded `get_demographic_attr` request, ready to be sent over the websocket.
+
+    """
+    # Encoded with `to_bytes`, like the whole request, so the bytes match the wire format.
+    _token: bytes = to_bytes(auth)
 
-    return _subject
+    return _DEMOGRAPHIC_ATTRIBUTES_PREFIX + _token + _DEMOGRAPHIC_ATTRIBUTES_SUFFIX
@@ -34,11 +34,28 @@ After step 2, but before step 3, you can send the **control "reset"** to cancel
 
 """
 
-from typing import Literal
+from collections.abc import Iterator, Mapping
+from typing import Any, Final, Literal
 
 from cortex.api.id import TrainingID
 from cortex.api.types import TrainingRequest
 
+_ID_TRAINING: Final[int] = int(TrainingID.TRAINING)
+_ID_SIGNATURE_ACTIONS: Final[int] = int(TrainingID.SIGNATURE_ACTIONS)
+_ID_TRAINING_TIME: Final[int] = int(TrainingID.TRAINING_TIME)
+
+_TRAINING: Final[Mapping[str, Any]] = {'id': _ID_TRAINING, 'jsonrpc': '2.0', 'method': 'training'}
+_TRAINED_SIGNATURE_ACTIONS: Final[Mapping[str, Any]] = {
+    'id': _ID_SIGNATURE_ACTIONS,
+    'jsonrpc': '2.0',
+    'method': 'getTrainedSignatureActions',
+}
+_TRAINING_TIME: Final[Mapping[str, Any]] = {'id': _ID_TRAINING_TIME, 'jsonrpc': '2.0', 'method': 'getTrainingTime'}
+
+# Valid detection types and training statuses.
+_DETECTIONS: Final[frozenset[str]] = frozenset(('mentalCommand', 'facialExpression'))
+_STATUSES: Final[frozenset[str]] = frozenset(('start', 'accept', 'reject', 'reset', 'erase'))
+
 
 def training(
     auth: str,
@@ -68,16 +85,31 @@ def training(
         TrainingRequest: The training status.
 
     """
-    if detection not in ('mentalCommand', 'facialExpression'):
+    if detection not in _DETECTIONS:
         raise ValueError('detection must be either "mentalCommand" or "facialExpression".')
 
-    if status not in ('start', 'accept', 'reject', 'reset', 'erase'):
+    if status not in _STATUSES:
         raise ValueError('status must be either "start", "accept", "reject", "reset", or "erase".')
 
-    _training = {
-        'id': TrainingID.TRAINING,
-        'jsonrpc': '2.0',
-        'method': 'training',
+    return _training_unchecked(auth, session_id, detection, status, action)
+
+
+def _training_unchecked(auth: str, session_id: str, detection: str, status: str, action: str) -> TrainingRequest:
+    """Build a `training` request from arguments that are known to be valid.
+
+    Args:
+        auth (str): The Cortex authentication token.
+        session_id (str): The session ID.
+        detection (str): The detection type, one of `_DETECTIONS`.
+        status (str): The training status, one of `_STATUSES`.
+        action (str): The action to train.
+
+    Returns:
+        TrainingRequest: The training status.
+
+    """
+    return {
+        **_TRAINING,
         'params': {
             'cortexToken': auth,
             'session': session_id,
@@ -87,7 +119,61 @@ def training(
         },
     }
 
-    return _training
+
+def training_sequence(
+    auth: str,
+    session_id: str,
+    detection: Literal['mentalCommand', 'facialExpression'],
+    action: str,
+    *,
+    accept: bool = True,
+) -> Iterator[TrainingRequest]:
+    """Yield the requests of a training, one step of the training workflow at a time.
+
+    Notes:
+        The first request starts the training. Call `next()` for the second one once
+        the "succeeded" event is received: it accepts the training (or rejects it if
+        `accept` is false). If the training fails, start a new sequence instead.
+
+    Args:
+        auth (str): The Cortex authentication token.
+        session_id (str): The session ID.
+        detection (Literal['mentalCommand', 'facialExpression']): The detection type.
+        action (str): The action to train.
+
+    Keyword Args:
+        accept (bool, optional): Accept the successful training, otherwise reject it.
+
+    Raises:
+        ValueError: If the detection is invalid.
+
+    Returns:
+        Iterator[TrainingRequest]: The "start" request, then the "accept" (or "reject") request.
+
+    """
+    # Validated once, here, rather than on every step.
+    if detection not in _DETECTIONS:
+        raise ValueError('detection must be either "mentalCommand" or "facialExpression".')
+
+    return _training_steps(auth, session_id, detection, action, 'accept' if accept else 'reject')
+
+
+def _training_steps(auth: str, session_id: str, detection: str, action: str, outcome: str) -> Iterator[TrainingRequest]:
+    """Yield the requests of a validated training sequence.
+
+    Args:
+        auth (str): The Cortex authentication token.
+        session_id (str): The session ID.
+        detection (str): The detection type, one of `_DETECTIONS`.
+        action (str): The action to train.
+        outcome (str): The status that ends the training, 'accept' or 'reject'.
+
+    Yields:
+        TrainingRequest: The "start" request, then the `outcome` request.
+
+    """
+    yield _training_unchecked(auth, session_id, detection, 'start', action)
+    yield _training_unchecked(auth, session_id, detection, outcome, action)
 
 
 def trained_signature_actions(
@@ -114,7 +200,7 @@ def trained_signature_actions(
         TrainingRequest: The trained signature actions.
 
     """
-    if detection not in ('mentalCommand', 'facialExpression'):
+    if detection not in _DETECTIONS:
         raise ValueError('detection must be either "mentalCommand" or "facialExpression".')
 
     _params = {'cortexToken': auth, 'detection': detection}
@@ -127,14 +213,7 @@ def trained_signature_actions(
     else:
         raise ValueError('Either profile_name or session_id must be provided, not both at the same time.')
 
-    _trained = {
-        'id': TrainingID.SIGNATURE_ACTIONS,
-        'jsonrpc': '2.0',
-        'method': 'getTrainedSignatureActions',
-        'params': _params,
-    }
-
-    return _trained
+    return {**_TRAINED_SIGNATURE_ACTIONS, 'params': _params}
 
 
 def training_time(
@@ -154,14 +233,7 @@ def training_time(
         TrainingRequest: The training time.
 
     """
-    if detection not in ('mentalCommand', 'facialExpression'):
+    if detection not in _DETECTIONS:
         raise ValueError('detection must be either "mentalCommand" or "facialExpression".')
 
-    _training_time = {
-        'id': TrainingID.TRAINING_TIME,
-        'jsonrpc': '2.0',
-        'method': 'getTrainingTime',
-        'params': {'cortexToken': auth, 'detection': detection, 'session': session_id},
-    }
-
-    return _training_time
+    return {**_TRAINING_TIME, 'params': {'cortexToken': auth, 'detection': detection, 'session': session_id}}
@@ -1,11 +1,15 @@
 """Type aliases for the Cortex API."""
 
+from __future__ import annotations
+
 from collections.abc import Mapping
 from typing import Any, Literal, TypeAlias, TypedDict
 
 # A dict with fields "from" and "to".
 Interval = TypedDict('Interval', {'from': str, 'to': str})
 ConnectionType: TypeAlias = Literal['bluetooth', 'usb cable', 'dongle']
+ExportFormat: TypeAlias = Literal['EDF', 'EDFPLUS', 'BDFPLUS', 'CSV']
+ProfileStatus: TypeAlias = Literal['create', 'load', 'unload', 'save', 'rename', 'delete']
 
 
 class Attribute(TypedDict):
@@ -109,16 +113,16 @@ MarkerRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | int | Map
 MentalCommandActionRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | list[str]]]
 
 # Records
-CreateRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | int | list[str]]]
-UpdateRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | list[str]]]
-DeleteRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, list[str]]]
-ExportRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | int | list[str] | bool]]
+CreateRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | int | tuple[str, ...]]]
+UpdateRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | tuple[str, ...]]]
+DeleteRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, tuple[str, ...]]]
+ExportRecordRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | int | tuple[str, ...] | bool]]
 QueryRecordRequest: TypeAlias = Mapping[
     str, str | int | Mapping[str, str | RecordQuery | int | bool | list[Mapping[str, str]]]
 ]
-RecordInfoRequest: TypeAlias = Mapping[str, str | int | Mapping[str, list[str]]]
+RecordInfoRequest: TypeAlias = Mapping[str, str | int | Mapping[str, tuple[str, ...]]]
 ConfigOptOutRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | bool]]
-DownloadRecordDataRequest: TypeAlias = Mapping[str, str | int | Mapping[str, list[str]]]
+DownloadRecordDataRequest: TypeAlias = Mapping[str, str | int | Mapping[str, tuple[str, ...]]]
 
 # Subject
 SubjectRequest: TypeAlias = Mapping[str, str | int | Mapping[str, str | list[Attribute]]]
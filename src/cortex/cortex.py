@@ -6,7 +6,6 @@ This module provides a Python interface to the Emotiv Cortex API.
 
 # pylint: disable=unused-argument
 import datetime
-import json
 import logging
 import os
 import ssl
@@ -23,7 +22,7 @@ from pydispatch import Dispatcher
 from cortex.api.auth import (
     access,
     authorize,
-    get_info,
+    encode_get_info,
     get_license_info,
     get_user_info,
     get_user_login,
@@ -31,8 +30,8 @@ from cortex.api.auth import (
 )
 from cortex.api.facial_expression import signature_type as fe_signature_type, threshold as fe_threshold
 from cortex.api.headset import (
+    encode_query_headset,
     make_connection,
-    query_headset,
     update_headset,
     update_custom_info,
     subscription,
@@ -52,10 +51,11 @@ from cortex.api.record import (
     stop_record,
     update_record,
 )
-from cortex.api.session import create_session, query_session, update_session
-from cortex.api.subject import create_subject, delete_subject, get_demographic_attr, query_subject, update_subject
+from cortex.api.serialize import to_bytes
+from cortex.api.session import create_session, encode_query_session, update_session
+from cortex.api.subject import create_subject, delete_subject, encode_demographic_attr, query_subject, update_subject
 from cortex.api.train import trained_signature_actions, training, training_time
-from cortex.api.types import Attribute, RecordQuery, Setting, SubjectQuery
+from cortex.api.types import Attribute, ExportFormat, ProfileStatus, RecordQuery, Setting, SubjectQuery
 from cortex.consts import CA_CERTS
 from cortex.logging import logger
 
@@ -201,11 +201,11 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
         """
         logger.info('--- Getting Cortex info ---')
 
-        _info = get_info()
+        _info = encode_get_info()
 
         logger.debug(_info)
 
-        self.ws.send(json.dumps(_info, indent=4))
+        self.ws.send(_info)
 
     def get_user_login(self) -> None:
         """Get the current logged in user.
@@ -220,7 +220,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_login)
 
-        self.ws.send(json.dumps(_login, indent=4))
+        self.ws.send(to_bytes(_login))
 
     def request_access(self) -> None:
         """Request user approval for the current application through [EMOTIV Launcher].
@@ -241,7 +241,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_access)
 
-        self.ws.send(json.dumps(_access, indent=4))
+        self.ws.send(to_bytes(_access))
 
     def has_access_right(self) -> None:
         """Request user approval for the current application through [EMOTIV Launcher].
@@ -262,7 +262,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_access)
 
-        self.ws.send(json.dumps(_access, indent=4))
+        self.ws.send(to_bytes(_access))
 
     def authorize(self) -> None:
         """This method is to generate a Cortex access token.
@@ -282,7 +282,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_authorize)
 
-        self.ws.send(json.dumps(_authorize, indent=4))
+        self.ws.send(to_bytes(_authorize))
 
     def generate_new_token(self) -> None:
         """Generate a new token. Use it to extend the expiration date of a token.
@@ -297,7 +297,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_token)
 
-        self.ws.send(json.dumps(_token, indent=4))
+        self.ws.send(to_bytes(_token))
 
     def get_user_info(self) -> None:
         """Get the current user information.
@@ -312,7 +312,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_info)
 
-        self.ws.send(json.dumps(_info, indent=4))
+        self.ws.send(to_bytes(_info))
 
     def get_license_info(self) -> None:
         """Get the license information.
@@ -327,7 +327,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_license)
 
-        self.ws.send(json.dumps(_license, indent=4))
+        self.ws.send(to_bytes(_license))
 
     # +-----------------------------------------------------------------------
     # |                     Headset
@@ -349,7 +349,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_connection)
 
-        self.ws.send(json.dumps(_connection, indent=4))
+        self.ws.send(to_bytes(_connection))
 
     def disconnect(self, mappings: Mapping[str, str] | None = None, connection_type: str | None = None) -> None:
         """Disconnect from the headset.
@@ -367,7 +367,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_connection)
 
-        self.ws.send(json.dumps(_connection, indent=4))
+        self.ws.send(to_bytes(_connection))
 
     def refresh(self) -> None:
         """Refresh the headset connection.
@@ -382,7 +382,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_connection)
 
-        self.ws.send(json.dumps(_connection, indent=4))
+        self.ws.send(to_bytes(_connection))
 
     def query_headset(self, *, include_flex_mappings: bool = False) -> None:
         """Query the headset.
@@ -393,11 +393,11 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
         """
         logger.info('--- Querying the headset ---')
 
-        _query = query_headset(self.headset_id, include_flex_mappings=include_flex_mappings)
+        _query = encode_query_headset(self.headset_id, include_flex_mappings=include_flex_mappings)
 
         logger.debug(_query)
 
-        self.ws.send(json.dumps(_query, indent=4))
+        self.ws.send(_query)
 
     def update_headset(self, settings: Setting) -> None:  # noqa: D417
         """Update the headset.
@@ -412,7 +412,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_update)
 
-        self.ws.send(json.dumps(_update, indent=4))
+        self.ws.send(to_bytes(_update))
 
     def update_custom_info(self, headband_position: Literal['back', 'top']) -> None:
         """Update the custom info.
@@ -427,7 +427,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_update)
 
-        self.ws.send(json.dumps(_update, indent=4))
+        self.ws.send(to_bytes(_update))
 
     def sync_with_clock(self, monotonic_time: float, system_time: float) -> None:
         """Synchronize the monotonic clock of your application with the monotonic clock of Cortex.
@@ -445,7 +445,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_sync)
 
-        self.ws.send(json.dumps(_sync, indent=4))
+        self.ws.send(to_bytes(_sync))
 
     # +-----------------------------------------------------------------------
     # |                     Sessions
@@ -476,7 +476,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_session)
 
-        self.ws.send(json.dumps(_session, indent=4))
+        self.ws.send(to_bytes(_session))
 
     def close_session(self) -> None:
         """Close a session with an Emotiv headset.
@@ -490,17 +490,17 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_session)
 
-        self.ws.send(json.dumps(_session, indent=4))
+        self.ws.send(to_bytes(_session))
 
     def query_session(self) -> None:
         """Get the list of current sessions created by this application."""
         logger.info('--- Querying session ---')
 
-        _session = query_session(self.auth)
+        _session = encode_query_session(self.auth)
 
         logger.debug(_session)
 
-        self.ws.send(json.dumps(_session, indent=4))
+        self.ws.send(_session)
 
     # +-----------------------------------------------------------------------
     # |                     Data Subscription
@@ -525,7 +525,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_request)
 
-        self.ws.send(json.dumps(_request, indent=4))
+        self.ws.send(to_bytes(_request))
 
     def unsubscribe(self, streams: list[str]) -> None:
         """Unsubscribe from one or more data stream.
@@ -546,7 +546,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_request)
 
-        self.ws.send(json.dumps(_request, indent=4))
+        self.ws.send(to_bytes(_request))
 
     # +-----------------------------------------------------------------------
     # |                     Records
@@ -580,7 +580,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_record)
 
-        self.ws.send(json.dumps(_record, indent=4))
+        self.ws.send(to_bytes(_record))
 
     def stop_record(self) -> None:
         """Stop the record."""
@@ -593,7 +593,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_record)
 
-        self.ws.send(json.dumps(_record, indent=4))
+        self.ws.send(to_bytes(_record))
 
     def update_record(self, record_id: str, **kwargs: str | list[str]) -> None:  # noqa: D417
         """Update a record.
@@ -616,7 +616,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_record)
 
-        self.ws.send(json.dumps(_record, indent=4))
+        self.ws.send(to_bytes(_record))
 
     def delete_record(self, records: list[str]) -> None:
         """Delete one or more records.
@@ -631,15 +631,15 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_record)
 
-        self.ws.send(json.dumps(_record, indent=4))
+        self.ws.send(to_bytes(_record))
 
     def export_record(  # noqa: D417
         self,
         record_ids: list[str],
         folder: str | Path,
         stream_types: list[str],
-        # pylint: disable-next=redefined-builtin,implicit-str-concat
-        format: Literal['EDF' 'EDFPLUS', 'BDFPLUS', 'CSV'],
+        # pylint: disable-next=redefined-builtin
+        format: ExportFormat,
         **kwargs: str | list[str] | bool,
     ) -> None:
         """Export one or more records.
@@ -648,7 +648,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
             record_ids (list[str]): The record IDs.
             folder (str | Path): The folder to save the records.
             stream_types (list[str]): The stream types.
-            format (Literal['EDF' 'EDFPLUS', 'BDFPLUS', 'CSV']): The format.
+            format (ExportFormat): The format, one of 'EDF', 'EDFPLUS', 'BDFPLUS' or 'CSV'.
 
         Keyword Args:
             version (Literal['V1', 'V2']): The version of the CSV format.
@@ -678,7 +678,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_export)
 
-        self.ws.send(json.dumps(_export, indent=4))
+        self.ws.send(to_bytes(_export))
 
     def query_records(  # noqa: D417
         self, query: RecordQuery, order_by: list[dict[str, Literal['ASC', 'DESC']]], **kwargs: int | bool
@@ -691,7 +691,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         Keyword Args:
             limit (int): The maximum number of records to return.
-            offset (int): The number of records to skip.
+            offset (int): The number of records to skip. Requires `limit`.
             include_markers (bool): If `true` the the markers of the records will be included.
             include_sync_status_info (bool): If `true` the the sync status of the records will be included.
 
@@ -702,7 +702,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_query)
 
-        self.ws.send(json.dumps(_query, indent=4))
+        self.ws.send(to_bytes(_query))
 
     def get_record_info(self, record_ids: list[str]) -> None:
         """Get the record information.
@@ -719,7 +719,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
         logger.debug('Getting record information.')
         logger.debug(record)
 
-        self.ws.send(json.dumps(record, indent=4))
+        self.ws.send(to_bytes(record))
 
     def set_config_opt_out(self, opt_out: bool) -> None:
         """Set the config opt out.
@@ -734,7 +734,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_config)
 
-        self.ws.send(json.dumps(_config, indent=4))
+        self.ws.send(to_bytes(_config))
 
     def get_config_opt_out(self) -> None:
         """Get the config opt out."""
@@ -744,7 +744,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_config)
 
-        self.ws.send(json.dumps(_config, indent=4))
+        self.ws.send(to_bytes(_config))
 
     def download_record_data(self, record_ids: list[str]) -> None:
         """Download the record data.
@@ -759,7 +759,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_download)
 
-        self.ws.send(json.dumps(_download, indent=4))
+        self.ws.send(to_bytes(_download))
 
     # +-----------------------------------------------------------------------
     # |                     Markers
@@ -787,7 +787,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_marker)
 
-        self.ws.send(json.dumps(_marker, indent=4))
+        self.ws.send(to_bytes(_marker))
 
     def update_marker(self, marker_id: str, time: int, **kwargs: str | Any) -> None:  # noqa: D417
         """Update a marker.
@@ -812,7 +812,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_marker)
 
-        self.ws.send(json.dumps(_marker, indent=4))
+        self.ws.send(to_bytes(_marker))
 
     # +-----------------------------------------------------------------------
     # |                     Subjects
@@ -839,7 +839,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_subject)
 
-        self.ws.send(json.dumps(_subject, indent=4))
+        self.ws.send(to_bytes(_subject))
 
     def update_subject(self, subject_name: str, **kwargs: str | list[Attribute]) -> None:
         """Update a subject.
@@ -863,7 +863,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_subject)
 
-        self.ws.send(json.dumps(_subject, indent=4))
+        self.ws.send(to_bytes(_subject))
 
     def delete_subject(self, subject_name: str) -> None:
         """Delete a subject.
@@ -878,7 +878,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_subject)
 
-        self.ws.send(json.dumps(_subject, indent=4))
+        self.ws.send(to_bytes(_subject))
 
     def query_subject(
         self, query: SubjectQuery, order_by: list[dict[str, Literal['ASC', 'DESC']]], **kwargs: int
@@ -901,17 +901,17 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_subject)
 
-        self.ws.send(json.dumps(_subject, indent=4))
+        self.ws.send(to_bytes(_subject))
 
     def get_demographic_attr(self) -> None:
         """Get the demographic attributes."""
         logger.info('--- Getting demographic attributes ---')
 
-        _demographic = get_demographic_attr(self.auth)
+        _demographic = encode_demographic_attr(self.auth)
 
         logger.debug(_demographic)
 
-        self.ws.send(json.dumps(_demographic, indent=4))
+        self.ws.send(_demographic)
 
     # +-----------------------------------------------------------------------
     # |                     BCI (Profile)
@@ -925,7 +925,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_query)
 
-        self.ws.send(json.dumps(_query, indent=4))
+        self.ws.send(to_bytes(_query))
 
     def get_current_profile(self) -> None:
         """Get the current profile."""
@@ -938,19 +938,14 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_profile)
 
-        self.ws.send(json.dumps(_profile, indent=4))
+        self.ws.send(to_bytes(_profile))
 
-    def setup_profile(
-        self,
-        status: Literal['create', 'load', 'unload', 'save', 'rename', 'delete'],
-        profile_name: str,
-        *,
-        new_profile_name: str | None = None,
-    ) -> None:
+    def setup_profile(self, status: ProfileStatus, profile_name: str, *, new_profile_name: str | None = None) -> None:
         """Setup a profile.
 
         Args:
-            status (Literal['create', 'load', 'unload', 'save', 'rename', 'delete']): The status of the profile.
+            status (ProfileStatus): The status of the profile, one of 'create', 'load',
+                'unload', 'save', 'rename' or 'delete'.
             profile_name (str): The profile name.
 
         Keyword Args:
@@ -972,7 +967,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_profile)
 
-        self.ws.send(json.dumps(_profile, indent=4))
+        self.ws.send(to_bytes(_profile))
 
     # +-----------------------------------------------------------------------
     # |                     Advanced BCI (Training)
@@ -1001,7 +996,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_training)
 
-        self.ws.send(json.dumps(_training, indent=4))
+        self.ws.send(to_bytes(_training))
 
     def training_signature_action(self, detection: Literal['mentalCommand', 'facialExpression']) -> None:  # noqa: D417
         """Get the list of trained actions of a profile.
@@ -1021,7 +1016,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_training)
 
-        self.ws.send(json.dumps(_training, indent=4))
+        self.ws.send(to_bytes(_training))
 
     def training_time(self, detection: Literal['mentalCommand', 'facialExpression']) -> None:
         """Get the training time.
@@ -1039,7 +1034,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_training)
 
-        self.ws.send(json.dumps(_training, indent=4))
+        self.ws.send(to_bytes(_training))
 
     # +-----------------------------------------------------------------------
     # |                     Advanced BCI (Facial Expression)
@@ -1058,7 +1053,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_signature)
 
-        self.ws.send(json.dumps(_signature, indent=4))
+        self.ws.send(to_bytes(_signature))
 
     def set_fe_signature_type(self, profile_name: str, signature: Literal['universal', 'trained']) -> None:
         """Set the facial expression signature type.
@@ -1074,7 +1069,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_signature)
 
-        self.ws.send(json.dumps(_signature, indent=4))
+        self.ws.send(to_bytes(_signature))
 
     def get_fe_threshold(self, profile_name: str) -> None:
         """Get the facial expression threshold.
@@ -1089,7 +1084,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_threshold)
 
-        self.ws.send(json.dumps(_threshold, indent=4))
+        self.ws.send(to_bytes(_threshold))
 
     def set_fe_threshold(self, profile_name: str, value: int) -> None:
         """Set the facial expression threshold.
@@ -1105,7 +1100,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_threshold)
 
-        self.ws.send(json.dumps(_threshold, indent=4))
+        self.ws.send(to_bytes(_threshold))
 
     # +-----------------------------------------------------------------------
     # |                     Advanced BCI (Mental Command)
@@ -1124,7 +1119,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_action)
 
-        self.ws.send(json.dumps(_action, indent=4))
+        self.ws.send(to_bytes(_action))
 
     def set_mc_active_action(self, actions: list[str]) -> None:
         """Set the active mental command action.
@@ -1142,7 +1137,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_action)
 
-        self.ws.send(json.dumps(_action, indent=4))
+        self.ws.send(to_bytes(_action))
 
     def get_mc_brain_map(self, profile_name: str) -> None:
         """Get the mental command brain map.
@@ -1157,7 +1152,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_brain_map)
 
-        self.ws.send(json.dumps(_brain_map, indent=4))
+        self.ws.send(to_bytes(_brain_map))
 
     def get_mc_command_skill_rating(self, action: str | None = None) -> None:
         """Get the mental command skill rating.
@@ -1177,7 +1172,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_rating)
 
-        self.ws.send(json.dumps(_rating, indent=4))
+        self.ws.send(to_bytes(_rating))
 
     def get_mc_training_threshold(self, profile_name: str) -> None:
         """Get the mental command training threshold.
@@ -1192,7 +1187,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_threshold)
 
-        self.ws.send(json.dumps(_threshold, indent=4))
+        self.ws.send(to_bytes(_threshold))
 
     def get_mc_action_sensitive(self, profile_name: str) -> None:
         """Get the mental command action sensitivity.
@@ -1207,7 +1202,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_sensitivity)
 
-        self.ws.send(json.dumps(_sensitivity, indent=4))
+        self.ws.send(to_bytes(_sensitivity))
 
     def set_mc_action_sensitive(self, profile_name: str, values: list[int]) -> None:
         """Set the mental command action sensitivity.
@@ -1223,7 +1218,7 @@ class Cortex(Dispatcher, metaclass=InheritEventsMeta):
 
         logger.debug(_sensitivity)
 
-        self.ws.send(json.dumps(_sensitivity, indent=4))
+        self.ws.send(to_bytes(_sensitivity))
 
     # +-----------------------------------------------------------------------
     # |                     Setters
@@ -10,6 +10,7 @@ import time as m_time
 from collections.abc import Callable, Mapping
 from typing import Any, ClassVar
 
+from cortex.api.batch import original_id
 from cortex.api.events import (
     ErrorEvent,
     MarkerEvent,
@@ -87,7 +88,39 @@ class Headset(Cortex):
 
     def on_message(self, *args: Any, **kwargs: Any) -> None:
         """Handle the message."""
-        recv_dict = json.loads(args[1])
+        message = json.loads(args[1])
+        if isinstance(message, list):
+            self.handle_batch(message)
+        else:
+            self.handle_message(message)
+
+    def handle_batch(self, responses: list[dict[str, Any]]) -> None:
+        """Handle the responses of a JSON-RPC batch (see `cortex.api.batch`).
+
+        Notes:
+            Each response is handled like the response of a single request of the
+            same method, using the ID of the request before it was batched.
+
+        Args:
+            responses (list[dict[str, Any]]): The responses of the batch, in any order.
+
+        """
+        for response in responses:
+            # Cortex answers an invalid request of the batch with a null ID, keep it as is.
+            if isinstance(id_ := response.get('id'), int):
+                response = {**response, 'id': original_id(id_)}
+            self.handle_message(response)
+
+    def handle_message(self, recv_dict: Mapping[str, Any]) -> None:
+        """Handle a single message.
+
+        Args:
+            recv_dict (Mapping[str, Any]): The decoded message.
+
+        Raises:
+            KeyError: If the message type is unknown.
+
+        """
         if 'sid' in recv_dict:
             self.handle_stream_data(recv_dict)
         elif 'result' in recv_dict:
@@ -9,12 +9,14 @@ from cortex.api.auth import (
     AuthID,
     access,
     authorize,
+    encode_get_info,
     generate_new_token,
     get_info,
     get_license_info,
     get_user_info,
     get_user_login,
 )
+from cortex.api.serialize import to_bytes
 
 # Constants.
 AUTH_TOKEN: Final[str] = 'xxx'
@@ -91,3 +93,15 @@ def test_get_license_info(api_request: APIRequest) -> None:
     assert get_license_info(AUTH_TOKEN) == api_request(
         id=AuthID.LICENSE_INFO, method='getLicenseInfo', params={'cortexToken': AUTH_TOKEN}
     )
+
+
+def test_requests_are_independent() -> None:
+    """Test that a request can be changed without affecting the next one."""
+    get_info()['params'] = {}
+    assert 'params' not in get_info()
+
+
+def test_encode_get_info() -> None:
+    """Test encoding the Cortex info request."""
+    assert encode_get_info() == to_bytes(get_info())
+    assert encode_get_info() is encode_get_info()
@@ -0,0 +1,59 @@
+"""Test for the batch module."""
+
+from typing import Final
+
+import pytest
+
+from cortex.api.batch import batch, original_id, split_batch_response
+from cortex.api.id import SubjectsID
+from cortex.api.subject import create_subject, delete_subject
+from cortex.api.train import training
+
+# Constants.
+AUTH_TOKEN: Final[str] = 'xxx'
+SESSION_ID: Final[str] = 'f3a35fd0-9163-4cc4-ab30-4ed224369f91'
+
+
+def test_batch() -> None:
+    """Test packing requests into a batch."""
+    requests = [
+        create_subject(AUTH_TOKEN, 'subject1'),
+        create_subject(AUTH_TOKEN, 'subject2'),
+        training(AUTH_TOKEN, SESSION_ID, 'mentalCommand', 'start', 'push'),
+    ]
+    _batch = batch(requests)
+
+    assert len({request['id'] for request in _batch}) == len(requests)
+    for request, batched in zip(requests, _batch, strict=True):
+        assert {**batched, 'id': request['id']} == request
+
+    # The requests are not modified, and every batch gets new IDs.
+    assert requests[0]['id'] != _batch[0]['id']
+    assert not {request['id'] for request in _batch} & {request['id'] for request in batch(requests)}
+
+
+def test_split_batch_response() -> None:
+    """Test matching the responses of a batch to its requests."""
+    _batch = batch([create_subject(AUTH_TOKEN, 'subject1'), delete_subject(AUTH_TOKEN, 'subject2')])
+    created = {'id': _batch[0]['id'], 'jsonrpc': '2.0', 'result': {'subjectName': 'subject1'}}
+    failed = {'id': _batch[1]['id'], 'jsonrpc': '2.0', 'error': {'code': -32000, 'message': 'Not found.'}}
+
+    assert split_batch_response(_batch, [failed, created]) == [created, failed]
+
+    with pytest.raises(ValueError, match=f'No response to the batch request {_batch[1]["id"]}.'):
+        split_batch_response(_batch, [created])
+
+
+def test_batch_round_trip() -> None:
+    """Test matching the responses of a batch back to the original requests."""
+    requests = [create_subject(AUTH_TOKEN, 'subject1'), delete_subject(AUTH_TOKEN, 'subject2')]
+    _batch = batch(requests)
+    responses = [{'id': request['id'], 'jsonrpc': '2.0', 'result': {}} for request in reversed(_batch)]
+
+    matched = split_batch_response(_batch, responses)
+
+    assert [response['id'] for response in matched] == [request['id'] for request in _batch]
+    assert [original_id(response['id']) for response in matched] == [SubjectsID.CREATE, SubjectsID.DELETE]
+
+    # IDs of requests which aren't batched are returned as is.
+    assert original_id(requests[0]['id']) == SubjectsID.CREATE
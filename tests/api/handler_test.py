@@ -44,3 +44,9 @@ def test_stream_data_invalid_key(sample_data: SampleData) -> None:
     """Test streaming with an invalid key."""
     with pytest.raises(KeyError, match='Unknown key: invalid'):
         stream_data(sample_data, 'invalid')
+
+
+def test_stream_data_single_stream() -> None:
+    """Test streaming data that only carries the requested stream."""
+    assert stream_data({'mot': [1, 2, 3], 'time': SAMPLE_TIME}, 'mot') == {'mot': [1, 2, 3], 'time': SAMPLE_TIME}
+    assert stream_data({'sys': ['ok'], 'time': SAMPLE_TIME}, 'sys') == ['ok']
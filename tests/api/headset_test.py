@@ -6,6 +6,7 @@ from collections.abc import Callable
 from typing import Any, Final, TypeAlias
 
 from cortex.api.headset import (
+    encode_query_headset,
     make_connection,
     query_headset,
     update_headset,
@@ -13,6 +14,7 @@ from cortex.api.headset import (
     sync_with_clock,
     subscription,
 )
+from cortex.api.serialize import to_bytes
 from cortex.api.types import Setting
 from cortex.api.id import HeadsetID
 
@@ -260,3 +262,15 @@ def test_subscription(api_request: APIRequest) -> None:
 
     with pytest.raises(ValueError, match='method must be either "subscribe" or "unsubscribe".'):
         subscription(AUTH_TOKEN, SESSION_ID, streams, 'invalid')
+
+
+def test_encode_query_headset() -> None:
+    """Test encoding the headset query."""
+    assert encode_query_headset(HEADSET_ID) == to_bytes(query_headset(HEADSET_ID))
+    assert encode_query_headset(HEADSET_ID) is encode_query_headset(HEADSET_ID)
+    assert encode_query_headset(EPOC_FLEX_ID, include_flex_mappings=True) == to_bytes(
+        query_headset(EPOC_FLEX_ID, include_flex_mappings=True)
+    )
+
+    # Same wire format as every other request, including for non-ASCII IDs.
+    assert encode_query_headset('INSIGHT-é*') == to_bytes(query_headset('INSIGHT-é*'))
@@ -0,0 +1,108 @@
+"""Tests for the request IDs."""
+
+from collections.abc import Mapping
+from typing import Any, Final
+
+import pytest
+
+from cortex.api.auth import (
+    access,
+    authorize,
+    generate_new_token,
+    get_info,
+    get_license_info,
+    get_user_info,
+    get_user_login,
+)
+from cortex.api.facial_expression import signature_type, threshold
+from cortex.api.headset import make_connection, query_headset, subscription, sync_with_clock, update_custom_info
+from cortex.api.markers import inject_marker, update_marker
+from cortex.api.mental_command import action_sensitivity, active_action, brain_map, get_skill_rating, training_threshold
+from cortex.api.profile import current_profile, detection_info, load_guest, query_profile, setup_profile
+from cortex.api.record import (
+    config_opt_out,
+    create_record,
+    delete_record,
+    download_record_data,
+    record_infos,
+    stop_record,
+    update_record,
+)
+from cortex.api.session import create_session, query_session, update_session
+from cortex.api.subject import create_subject, delete_subject, get_demographic_attr, query_subject, update_subject
+from cortex.api.train import trained_signature_actions, training, training_time
+
+# Constants.
+AUTH_TOKEN: Final[str] = 'xxx'
+CLIENT_ID: Final[str] = 'xxx'
+SESSION_ID: Final[str] = 'f3a35fd0-9163-4cc4-ab30-4ed224369f91'
+HEADSET_ID: Final[str] = 'INSIGHT-12341234'
+PROFILE_NAME: Final[str] = 'cortex-v2-example'
+RECORD_IDS: Final[list[str]] = ['d8fe7658-71f1-4cd6-bb5d-f6775b03438f']
+
+# One request of each builder (and of each request ID, for builders with several).
+REQUESTS: Final[list[Mapping[str, Any]]] = [
+    # Auth.
+    get_info(),
+    get_user_login(),
+    access(CLIENT_ID, CLIENT_ID, method='requestAccess'),
+    access(CLIENT_ID, CLIENT_ID, method='hasAccessRight'),
+    authorize(CLIENT_ID, CLIENT_ID),
+    generate_new_token(AUTH_TOKEN, CLIENT_ID, CLIENT_ID),
+    get_user_info(AUTH_TOKEN),
+    get_license_info(AUTH_TOKEN),
+    # Facial expression.
+    signature_type(AUTH_TOKEN, 'get', session_id=SESSION_ID),
+    threshold(AUTH_TOKEN, 'get', 'smile', session_id=SESSION_ID),
+    # Headset.
+    make_connection('refresh'),
+    make_connection('disconnect', headset_id=HEADSET_ID),
+    query_headset(),
+    update_custom_info(AUTH_TOKEN, HEADSET_ID, 'back'),
+    sync_with_clock(HEADSET_ID, 1.0, 1.0),
+    subscription(AUTH_TOKEN, SESSION_ID, ['eeg'], 'subscribe'),
+    subscription(AUTH_TOKEN, SESSION_ID, ['eeg'], 'unsubscribe'),
+    # Markers.
+    inject_marker(AUTH_TOKEN, SESSION_ID, 1.0, 1, 'label'),
+    update_marker(AUTH_TOKEN, SESSION_ID, 'marker-id', 1.0),
+    # Mental command.
+    active_action(AUTH_TOKEN, 'get', session_id=SESSION_ID),
+    brain_map(AUTH_TOKEN, profile_name=PROFILE_NAME),
+    get_skill_rating(AUTH_TOKEN, session_id=SESSION_ID),
+    training_threshold(AUTH_TOKEN, session_id=SESSION_ID),
+    action_sensitivity(AUTH_TOKEN, 'get', profile_name=PROFILE_NAME),
+    # Profile.
+    query_profile(AUTH_TOKEN),
+    current_profile(AUTH_TOKEN, HEADSET_ID),
+    setup_profile(AUTH_TOKEN, 'load', PROFILE_NAME, headset_id=HEADSET_ID),
+    load_guest(AUTH_TOKEN, HEADSET_ID),
+    detection_info('mentalCommand'),
+    # Record.
+    create_record(AUTH_TOKEN, SESSION_ID, 'title'),
+    stop_record(AUTH_TOKEN, SESSION_ID),
+    update_record(AUTH_TOKEN, RECORD_IDS[0], title='title'),
+    delete_record(AUTH_TOKEN, RECORD_IDS),
+    record_infos(AUTH_TOKEN, RECORD_IDS),
+    config_opt_out(AUTH_TOKEN, 'get'),
+    download_record_data(AUTH_TOKEN, RECORD_IDS),
+    # Session.
+    create_session(AUTH_TOKEN, HEADSET_ID, 'open'),
+    update_session(AUTH_TOKEN, SESSION_ID, 'close'),
+    query_session(AUTH_TOKEN),
+    # Subject.
+    create_subject(AUTH_TOKEN, 'subject'),
+    update_subject(AUTH_TOKEN, 'subject'),
+    delete_subject(AUTH_TOKEN, 'subject'),
+    query_subject(AUTH_TOKEN, {}, []),
+    get_demographic_attr(AUTH_TOKEN),
+    # Training.
+    training(AUTH_TOKEN, SESSION_ID, 'mentalCommand', 'start', 'push'),
+    trained_signature_actions(AUTH_TOKEN, 'mentalCommand', session_id=SESSION_ID),
+    training_time(AUTH_TOKEN, 'mentalCommand', SESSION_ID),
+]
+
+
+@pytest.mark.parametrize('api_call', REQUESTS, ids=[f'{r["method"]}-{r["id"]}' for r in REQUESTS])
+def test_request_id_is_plain_int(api_call: Mapping[str, Any]) -> None:
+    """Test that the request IDs are stored as plain ints, not as IntEnum members."""
+    assert type(api_call['id']) is int
@@ -99,3 +99,14 @@ def test_update_marker(api_request: APIRequest) -> None:
             'extras': extras,
         },
     )
+
+
+def test_marker_extras_are_not_copied() -> None:
+    """Test that the marker extras are sent as given, without a copy."""
+    extras = {'key': 'value'}
+
+    assert (
+        inject_marker(AUTH_TOKEN, SESSION_ID, time_, marker_value, marker_label, extras=extras)['params']['extras']
+        is extras
+    )
+    assert update_marker(AUTH_TOKEN, SESSION_ID, 'marker-id', time_, extras=extras)['params']['extras'] is extras
@@ -1,12 +1,14 @@
 """Test for the record module."""
 
 from collections.abc import Callable
-from typing import Any, Final, TypeAlias
+from typing import Any, Final, TypeAlias, get_args
 
 import pytest
 
 from cortex.api.record import (
+    RecordClient,
     create_record,
+    create_records_batch,
     stop_record,
     update_record,
     delete_record,
@@ -16,8 +18,9 @@ from cortex.api.record import (
     config_opt_out,
     download_record_data,
 )
+from cortex.api.batch import original_id
 from cortex.api.id import RecordsID
-from cortex.api.types import RecordQuery
+from cortex.api.types import ExportFormat, RecordQuery
 
 # Constants.
 AUTH_TOKEN: Final[str] = 'xxx'
@@ -58,11 +61,50 @@ def test_create_record(api_request: APIRequest) -> None:
             'title': title,
             'description': description,
             'subjectName': subject_name,
-            'tags': tags,
+            'tags': tuple(tags),
             'experimentId': experiment_id,
         },
     )
 
+    assert create_record(AUTH_TOKEN, SESSION_ID, title, tags=tags, experiment_id=0) == api_request(
+        id=RecordsID.CREATE,
+        method='createRecord',
+        params={
+            'cortexToken': AUTH_TOKEN,
+            'session': SESSION_ID,
+            'title': title,
+            'tags': tuple(tags),
+            'experimentId': 0,
+        },
+    )
+
+
+def test_create_records_batch(api_request: APIRequest) -> None:
+    """Test creating several records in a single batch."""
+    items = [
+        {'session_id': SESSION_ID, 'title': 'First record'},
+        {'session_id': SESSION_ID, 'title': 'Second record', 'tags': ['tag1']},
+    ]
+
+    _batch = create_records_batch(AUTH_TOKEN, items)
+
+    # Every request has its own ID, which maps back to the createRecord ID.
+    assert len({request['id'] for request in _batch}) == len(items)
+    assert [{**request, 'id': original_id(request['id'])} for request in _batch] == [
+        api_request(
+            id=RecordsID.CREATE,
+            method='createRecord',
+            params={'cortexToken': AUTH_TOKEN, 'session': SESSION_ID, 'title': 'First record'},
+        ),
+        api_request(
+            id=RecordsID.CREATE,
+            method='createRecord',
+            params={'cortexToken': AUTH_TOKEN, 'session': SESSION_ID, 'title': 'Second record', 'tags': ('tag1',)},
+        ),
+    ]
+
+    assert create_records_batch(AUTH_TOKEN, []) == []
+
 
 def test_stop_record(api_request: APIRequest) -> None:
     """Test stopping a record."""
@@ -96,7 +138,7 @@ def test_update_record(api_request: APIRequest) -> None:
             'record': record_id,
             'title': title,
             'description': description,
-            'tags': tags,
+            'tags': tuple(tags),
         },
     )
 
@@ -106,7 +148,7 @@ def test_delete_record(api_request: APIRequest) -> None:
     records = ['d8fe7658-71f1-4cd6-bb5d-f6775b03438f', 'invalid-id']
 
     assert delete_record(AUTH_TOKEN, records) == api_request(
-        id=RecordsID.DELETE, method='deleteRecord', params={'cortexToken': AUTH_TOKEN, 'records': records}
+        id=RecordsID.DELETE, method='deleteRecord', params={'cortexToken': AUTH_TOKEN, 'records': tuple(records)}
     )
 
 
@@ -122,9 +164,9 @@ def test_export_record(api_request: APIRequest) -> None:
         method='exportRecord',
         params={
             'cortexToken': AUTH_TOKEN,
-            'recordIds': records,
+            'recordIds': tuple(records),
             'folder': folder,
-            'streamTypes': stream_types,
+            'streamTypes': tuple(stream_types),
             'format': 'CSV',
         },
     )
@@ -134,9 +176,9 @@ def test_export_record(api_request: APIRequest) -> None:
         method='exportRecord',
         params={
             'cortexToken': AUTH_TOKEN,
-            'recordIds': records,
+            'recordIds': tuple(records),
             'folder': folder,
-            'streamTypes': stream_types,
+            'streamTypes': tuple(stream_types),
             'format': 'CSV',
             'version': 'V2',
         },
@@ -147,9 +189,9 @@ def test_export_record(api_request: APIRequest) -> None:
         method='exportRecord',
         params={
             'cortexToken': AUTH_TOKEN,
-            'recordIds': records,
+            'recordIds': tuple(records),
             'folder': folder,
-            'streamTypes': stream_types,
+            'streamTypes': tuple(stream_types),
             'format': 'EDFPLUS',
         },
     )
@@ -174,12 +216,12 @@ def test_export_record(api_request: APIRequest) -> None:
         method='exportRecord',
         params={
             'cortexToken': AUTH_TOKEN,
-            'recordIds': records,
+            'recordIds': tuple(records),
             'folder': folder,
-            'streamTypes': stream_types,
+            'streamTypes': tuple(stream_types),
             'format': 'CSV',
             'version': 'V2',
-            'licenseIds': license_ids,
+            'licenseIds': tuple(license_ids),
             'includeDemographics': True,
             'includeSurvey': True,
             'includeMarkerExtraInfos': True,
@@ -206,12 +248,6 @@ def test_query_records(api_request: APIRequest) -> None:
         params={'cortexToken': AUTH_TOKEN, 'query': query, 'orderBy': order_by},
     )
 
-    assert query_records(AUTH_TOKEN, query, order_by, offset=2) == api_request(
-        id=RecordsID.QUERY,
-        method='queryRecords',
-        params={'cortexToken': AUTH_TOKEN, 'query': query, 'orderBy': order_by},
-    )
-
     assert query_records(AUTH_TOKEN, RecordQuery(licenseId='license1'), order_by) == api_request(
         id=RecordsID.QUERY,
         method='queryRecords',
@@ -237,13 +273,16 @@ def test_query_records(api_request: APIRequest) -> None:
     with pytest.raises(ValueError, match='offset must be less than the limit.'):
         query_records(AUTH_TOKEN, query, order_by, limit=2, offset=3)
 
+    with pytest.raises(ValueError, match='offset requires a limit.'):
+        query_records(AUTH_TOKEN, query, order_by, offset=2)
+
 
 def test_record_infos(api_request: APIRequest) -> None:
     """Test getting record information."""
     records = ['d8fe7658-71f1-4cd6-bb5d-f6775b03438f', 'ec0ac33f-ad4e-48b1-bbc3-8502f5c49b62']
 
     assert record_infos(AUTH_TOKEN, records) == api_request(
-        id=RecordsID.INFO, method='getRecordInfos', params={'cortexToken': AUTH_TOKEN, 'recordIds': records}
+        id=RecordsID.INFO, method='getRecordInfos', params={'cortexToken': AUTH_TOKEN, 'recordIds': tuple(records)}
     )
 
 
@@ -276,5 +315,35 @@ def test_download_record(api_request: APIRequest) -> None:
     assert download_record_data(AUTH_TOKEN, records) == api_request(
         id=RecordsID.DOWNLOAD_DATA,
         method='requestToDownloadRecordData',
-        params={'cortexToken': AUTH_TOKEN, 'recordIds': records},
+        params={'cortexToken': AUTH_TOKEN, 'recordIds': tuple(records)},
     )
+
+
+def test_record_sequences_are_copied() -> None:
+    """Test that mutating the caller's list doesn't change a built request."""
+    records = ['d8fe7658-71f1-4cd6-bb5d-f6775b03438f']
+    request = delete_record(AUTH_TOKEN, records)
+    records.append('ec0ac33f-ad4e-48b1-bbc3-8502f5c49b62')
+
+    assert request['params']['records'] == ('d8fe7658-71f1-4cd6-bb5d-f6775b03438f',)
+
+
+def test_export_record_accepts_every_format() -> None:
+    """Test that every `ExportFormat` is accepted by `export_record`."""
+    for format in get_args(ExportFormat):
+        assert export_record(AUTH_TOKEN, [], '/tmp/cortex', [], format)['params']['format'] == format
+
+
+def test_record_client() -> None:
+    """Test building the record requests of a session."""
+    client = RecordClient(AUTH_TOKEN, SESSION_ID)
+
+    assert client.create('title') == create_record(AUTH_TOKEN, SESSION_ID, 'title')
+    assert client.create('title', description='description', tags=['tag1']) == create_record(
+        AUTH_TOKEN, SESSION_ID, 'title', description='description', tags=['tag1']
+    )
+    assert client.stop() == stop_record(AUTH_TOKEN, SESSION_ID)
+
+    # Requests never share the session params.
+    assert client.stop()['params'] is not client.stop()['params']
+    assert 'title' not in client.stop()['params']
@@ -0,0 +1,88 @@
+"""Test for the serialize module."""
+
+import json
+from types import MappingProxyType
+from typing import Final
+
+import pytest
+
+from cortex.api import serialize
+from cortex.api.record import create_records_batch, stop_record
+from cortex.api.serialize import JsonRpcRequest, to_bytes
+from cortex.api.subject import create_subject, query_subject
+from cortex.api.train import training
+
+# Constants.
+AUTH_TOKEN: Final[str] = 'xxx'
+SESSION_ID: Final[str] = 'f3a35fd0-9163-4cc4-ab30-4ed224369f91'
+
+
+def test_to_bytes() -> None:
+    """Test serializing a request."""
+    request = stop_record(AUTH_TOKEN, SESSION_ID)
+    encoded = to_bytes(request)
+
+    assert isinstance(encoded, bytes)
+    assert b' ' not in encoded
+    assert json.loads(encoded) == request
+
+
+def test_to_bytes_batch() -> None:
+    """Test serializing a batch of requests."""
+    batch = create_records_batch(AUTH_TOKEN, [{'session_id': SESSION_ID, 'title': 'title'}] * 2)
+
+    assert json.loads(to_bytes(batch)) == batch
+
+
+def test_to_bytes_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test serializing a request with the standard library fallback."""
+    monkeypatch.setattr(serialize, '_HAS_ORJSON', False)
+    request = stop_record(AUTH_TOKEN, SESSION_ID)
+
+    assert json.loads(to_bytes(request)) == request
+    assert b' ' not in to_bytes(request)
+
+
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_to_bytes_read_only_mapping(monkeypatch: pytest.MonkeyPatch, has_orjson: bool) -> None:
+    """Test serializing a request shared behind read-only views."""
+    monkeypatch.setattr(serialize, '_HAS_ORJSON', has_orjson and serialize._HAS_ORJSON)
+    request = stop_record(AUTH_TOKEN, SESSION_ID)
+    frozen = MappingProxyType({**request, 'params': MappingProxyType(request['params'])})
+
+    assert json.loads(to_bytes(frozen)) == request
+
+    with pytest.raises(TypeError, match='not JSON serializable'):
+        to_bytes({'params': object()})
+
+
+def test_to_bytes_request_object() -> None:
+    """Test serializing a compact request object."""
+    request = stop_record(AUTH_TOKEN, SESSION_ID)
+    encoded = to_bytes([JsonRpcRequest(request['id'], request['method'], request['params'])])
+
+    assert json.loads(encoded) == [request]
+
+
+def test_json_rpc_request() -> None:
+    """Test the compact JSON-RPC request."""
+    request = stop_record(AUTH_TOKEN, SESSION_ID)
+    compact = JsonRpcRequest(request['id'], request['method'], request['params'])
+
+    assert compact.to_request() == request
+    assert to_bytes(compact) == to_bytes(request)
+    assert not hasattr(compact, '__dict__')
+
+
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_to_bytes_subject_and_training(monkeypatch: pytest.MonkeyPatch, has_orjson: bool) -> None:
+    """Test that subject and training requests only hold JSON primitives."""
+    monkeypatch.setattr(serialize, '_HAS_ORJSON', has_orjson and serialize._HAS_ORJSON)
+    requests = [
+        create_subject(AUTH_TOKEN, 'subject', sex='F', attributes=[{'name': 'Education', 'value': 'Master'}]),
+        query_subject(AUTH_TOKEN, {'sex': 'F'}, [{'subjectName': 'ASC'}], limit=10, offset=2),
+        training(AUTH_TOKEN, SESSION_ID, 'mentalCommand', 'start', 'push'),
+    ]
+
+    # Compact stdlib JSON, with no custom encoding.
+    assert to_bytes(requests) == json.dumps(requests, separators=(',', ':')).encode()
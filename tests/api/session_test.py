@@ -1,11 +1,13 @@
 """Test for session module."""
 
+import json
 from collections.abc import Callable
 from typing import Any, Final, TypeAlias
 
 import pytest
 
-from cortex.api.session import create_session, update_session, query_session
+from cortex.api.serialize import to_bytes
+from cortex.api.session import create_session, update_session, query_session, encode_query_session
 from cortex.api.id import SessionID
 
 # Constants.
@@ -58,3 +60,23 @@ def test_query_session(api_request: APIRequest) -> None:
     assert query_session(AUTH_TOKEN) == api_request(
         id=SessionID.QUERY, method='querySession', params={'cortexToken': AUTH_TOKEN}
     )
+
+
+def test_session_requests_are_independent() -> None:
+    """Test that requests built from the same skeleton don't share state."""
+    first, second = query_session(AUTH_TOKEN), query_session('yyy')
+
+    assert first['params'] == {'cortexToken': AUTH_TOKEN}
+    assert second['params'] == {'cortexToken': 'yyy'}
+    assert first is not second
+
+
+def test_encode_query_session() -> None:
+    """Test encoding the session query."""
+    assert encode_query_session(AUTH_TOKEN) == to_bytes(query_session(AUTH_TOKEN))
+
+    # The token is encoded as a JSON string.
+    assert json.loads(encode_query_session('x"y\\z')) == query_session('x"y\\z')
+
+    # Non-ASCII tokens are encoded like the whole request.
+    assert encode_query_session('tökén') == to_bytes(query_session('tökén'))
@@ -5,7 +5,15 @@ import pytest
 from collections.abc import Callable
 from typing import Any, Final, TypeAlias
 
-from cortex.api.subject import create_subject, update_subject, query_subject, delete_subject, get_demographic_attr
+from cortex.api.serialize import to_bytes
+from cortex.api.subject import (
+    create_subject,
+    update_subject,
+    query_subject,
+    delete_subject,
+    get_demographic_attr,
+    encode_demographic_attr,
+)
 from cortex.api.id import SubjectsID
 from cortex.api.types import Attribute, SubjectQuery
 
@@ -67,7 +75,7 @@ def test_create_subject(api_request: APIRequest) -> None:
         },
     )
 
-    with pytest.raises(AssertionError, match='sex must be either "M", "F", or "U".'):
+    with pytest.raises(ValueError, match='sex must be either "M", "F", or "U".'):
         create_subject(AUTH_TOKEN, subject_name, sex='invalid')
 
 
@@ -167,3 +175,11 @@ def test_demographic_attr(api_request: APIRequest) -> None:
     assert get_demographic_attr(AUTH_TOKEN) == api_request(
         id=SubjectsID.DEMO_ATTR, method='getDemographicAttributes', params={'cortexToken': AUTH_TOKEN}
     )
+
+
+def test_encode_demographic_attr() -> None:
+    """Test encoding the demographic attributes request."""
+    assert encode_demographic_attr(AUTH_TOKEN) == to_bytes(get_demographic_attr(AUTH_TOKEN))
+
+    # Non-ASCII tokens are encoded like the whole request.
+    assert encode_demographic_attr('tökén') == to_bytes(get_demographic_attr('tökén'))
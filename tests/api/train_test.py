@@ -5,7 +5,7 @@ from typing import Any, Final, TypeAlias
 
 import pytest
 
-from cortex.api.train import training, trained_signature_actions, training_time
+from cortex.api.train import training, training_sequence, trained_signature_actions, training_time
 from cortex.api.id import TrainingID
 
 
@@ -105,3 +105,20 @@ def test_training_time(api_request: APIRequest) -> None:
     with pytest.raises(ValueError):
         # ValueError: detection must be either "facialExpression" or "mentalCommand".
         training_time(AUTH_TOKEN, 'invalid', SESSION_ID)
+
+
+def test_training_sequence() -> None:
+    """Test the requests of a training workflow."""
+    assert list(training_sequence(AUTH_TOKEN, SESSION_ID, 'mentalCommand', 'push')) == [
+        training(AUTH_TOKEN, SESSION_ID, 'mentalCommand', 'start', 'push'),
+        training(AUTH_TOKEN, SESSION_ID, 'mentalCommand', 'accept', 'push'),
+    ]
+
+    steps = training_sequence(AUTH_TOKEN, SESSION_ID, 'facialExpression', 'smile', accept=False)
+    assert next(steps)['params']['status'] == 'start'
+    assert next(steps)['params']['status'] == 'reject'
+    assert next(steps, None) is None
+
+    # Invalid arguments are rejected before the first step.
+    with pytest.raises(ValueError, match='detection must be either "mentalCommand" or "facialExpression".'):
+        training_sequence(AUTH_TOKEN, SESSION_ID, 'invalid', 'push')
@@ -0,0 +1,47 @@
+"""Tests for the headset module."""
+
+import json
+from typing import Any, Final
+
+import pytest
+
+from cortex.api.batch import batch
+from cortex.api.id import RecordsID
+from cortex.api.record import create_record, stop_record
+from cortex.headset import Headset
+
+# Constants.
+AUTH_TOKEN: Final[str] = 'xxx'
+SESSION_ID: Final[str] = 'f3a35fd0-9163-4cc4-ab30-4ed224369f91'
+
+
+def test_on_message_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the responses of a batch are handled like single responses."""
+    headset = Headset('client_id', 'client_secret')
+    handled: list[dict[str, Any]] = []
+    monkeypatch.setattr(headset, 'handle_result', handled.append)
+
+    _batch = batch([create_record(AUTH_TOKEN, SESSION_ID, 'title'), stop_record(AUTH_TOKEN, SESSION_ID)])
+    responses = [{'id': request['id'], 'jsonrpc': '2.0', 'result': {}} for request in reversed(_batch)]
+
+    headset.on_message(None, json.dumps(responses))
+
+    assert [response['id'] for response in handled] == [RecordsID.STOP, RecordsID.CREATE]
+
+
+def test_on_message_batch_invalid_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an error response with a null ID doesn't stop the batch."""
+    headset = Headset('client_id', 'client_secret')
+    errors: list[dict[str, Any]] = []
+    handled: list[dict[str, Any]] = []
+    monkeypatch.setattr(headset, 'handle_error', errors.append)
+    monkeypatch.setattr(headset, 'handle_result', handled.append)
+
+    _batch = batch([stop_record(AUTH_TOKEN, SESSION_ID)])
+    invalid = {'id': None, 'jsonrpc': '2.0', 'error': {'code': -32600, 'message': 'Invalid Request'}}
+    responses = [invalid, {'id': _batch[0]['id'], 'jsonrpc': '2.0', 'result': {}}]
+
+    headset.on_message(None, json.dumps(responses))
+
+    assert errors == [invalid]
+    assert [response['id'] for response in handled] == [RecordsID.STOP]